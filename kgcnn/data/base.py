@@ -60,7 +60,8 @@ class MemoryGraphList(list):
         iterable = iterable if iterable is not None else []
         super(MemoryGraphList, self).__init__(iterable)
         self.logger = module_logger
-        self.validate()
+        if self._require_validate:
+            self.validate()
 
     def validate(self):
         for i, x in enumerate(self):
@@ -109,16 +110,27 @@ class MemoryGraphList(list):
 
         return prop_list
 
+    @staticmethod
+    def _from_graph_dicts(graphs: list):
+        r"""Make a :obj:`MemoryGraphList` from a list of :obj:`GraphDict` items of another list, without validating
+        the items again. The graphs are not copied but shared with the original list. Also for subclasses like
+        :obj:`MemoryGraphDataset` a plain :obj:`MemoryGraphList` is returned."""
+        out = MemoryGraphList.__new__(MemoryGraphList)
+        out._require_validate = False
+        MemoryGraphList.__init__(out, graphs)
+        return out
+
     def __getitem__(self, item) -> Union[GraphDict, List]:
         # Does not make a copy of the data, as a python list does.
         if isinstance(item, int):
             return super(MemoryGraphList, self).__getitem__(item)
         if isinstance(item, slice):
-            return MemoryGraphList(super(MemoryGraphList, self).__getitem__(item))
-        if isinstance(item, (list, tuple)):
-            return MemoryGraphList([super(MemoryGraphList, self).__getitem__(int(i)) for i in item])
+            return self._from_graph_dicts(super(MemoryGraphList, self).__getitem__(item))
         if isinstance(item, np.ndarray):
-            return MemoryGraphList([super(MemoryGraphList, self).__getitem__(int(i)) for i in item])
+            item = item.tolist()
+        if isinstance(item, (list, tuple)):
+            get_item = super(MemoryGraphList, self).__getitem__
+            return self._from_graph_dicts([get_item(int(i)) for i in item])
         raise TypeError("Unsupported type for `MemoryGraphList` items.")
 
     def __setitem__(self, key, value):
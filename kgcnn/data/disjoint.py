@@ -0,0 +1,78 @@
+"""Standalone utilities to batch graphs into a single disjoint graph, from a list of numpy arrays or from ragged
+tensors. They are not used by the models or layers of kgcnn, which operate on ragged tensors directly, but can
+be used to feed disjoint graph representations to custom code or other libraries.
+"""
+import numpy as np
+import tensorflow as tf
+
+
+def disjoint_graph_from_numpy(nodes: list, edges: list = None, edge_indices: list = None):
+    r"""Batch a list of small graphs into a single disjoint graph, i.e. one large graph with unconnected
+    sub-graphs. Node and edge features are concatenated along the first axis and the edge indices are shifted by
+    the number of nodes of all previous graphs. The graph assignment of each node is returned as `batch_id` , which
+    can be used as `segment_ids` for graph pooling with e.g. :obj:`tf.math.segment_sum` .
+
+    .. code-block:: python
+
+        import numpy as np
+        nodes, edges, edge_indices, batch_id = disjoint_graph_from_numpy(
+            [np.array([[0.0], [1.0]]), np.array([[2.0]])], None, [np.array([[0, 1], [1, 0]]), np.array([[0, 0]])])
+        print(edge_indices)
+        # [[0 1] [1 0] [2 2]]
+        print(batch_id)
+        # [0 0 1]
+
+    Args:
+        nodes (list): List of node features as numpy arrays of shape `(N, ...)` .
+        edges (list): List of edge features as numpy arrays of shape `(M, ...)` . Can be None. Default is None.
+        edge_indices (list): List of edge indices as numpy arrays of shape `(M, 2)` . Can be None. Default is None.
+
+    Returns:
+        tuple: Flat nodes `(N_total, ...)` , flat edges `(M_total, ...)` , shifted edge indices `(M_total, 2)`
+        and `batch_id` of nodes `(N_total, )` . Edges or edge indices are None, if not given.
+    """
+    if len(nodes) == 0:
+        raise ValueError("Can not make disjoint graph from empty list of graphs.")
+    node_lengths = np.array([len(x) for x in nodes], dtype="int64")
+    nodes_flat = np.concatenate(nodes, axis=0)
+    batch_id = np.repeat(np.arange(len(nodes), dtype="int64"), node_lengths)
+
+    edges_flat = np.concatenate(edges, axis=0) if edges is not None else None
+
+    edge_indices_flat = None
+    if edge_indices is not None:
+        node_offsets = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(node_lengths)[:-1]])
+        edge_lengths = np.array([len(x) for x in edge_indices], dtype="int64")
+        edge_indices_flat = np.concatenate(edge_indices, axis=0).astype("int64")
+        edge_indices_flat = edge_indices_flat + np.expand_dims(np.repeat(node_offsets, edge_lengths), axis=-1)
+
+    return nodes_flat, edges_flat, edge_indices_flat, batch_id
+
+
+def disjoint_graph_from_ragged(nodes: tf.RaggedTensor, edges: tf.RaggedTensor = None,
+                               edge_indices: tf.RaggedTensor = None):
+    r"""Convert a batch of graphs in ragged tensor form into a single disjoint graph, analogous to
+    :obj:`disjoint_graph_from_numpy` . Only ragged tensors with `ragged_rank=1` are supported. The flat values are
+    used directly without copy and the edge indices are shifted by the row splits of the nodes.
+
+    Args:
+        nodes (tf.RaggedTensor): Node features of shape `(batch, [N], ...)` .
+        edges (tf.RaggedTensor): Edge features of shape `(batch, [M], ...)` . Can be None. Default is None.
+        edge_indices (tf.RaggedTensor): Edge indices of shape `(batch, [M], 2)` . Can be None. Default is None.
+
+    Returns:
+        tuple: Flat nodes `(N_total, ...)` , flat edges `(M_total, ...)` , shifted edge indices `(M_total, 2)`
+        and `batch_id` of nodes `(N_total, )` . Edges or edge indices are None, if not given.
+    """
+    nodes_flat = nodes.values
+    batch_id = nodes.value_rowids()
+
+    edges_flat = edges.values if edges is not None else None
+
+    edge_indices_flat = None
+    if edge_indices is not None:
+        node_offsets = tf.gather(nodes.row_splits[:-1], edge_indices.value_rowids())
+        edge_indices_flat = edge_indices.values + tf.expand_dims(
+            tf.cast(node_offsets, dtype=edge_indices.dtype), axis=-1)
+
+    return nodes_flat, edges_flat, edge_indices_flat, batch_id
@@ -153,8 +153,12 @@ def ragged_tensor_from_nested_numpy(numpy_list: list, dtype: str = None, row_spl
     Returns:
         tf.RaggedTensor: Ragged tensor of former nested list of numpy arrays.
     """
-    return tf.RaggedTensor.from_row_lengths(
-        np.concatenate(numpy_list, axis=0, dtype=dtype), np.array([len(x) for x in numpy_list], dtype=row_splits_dtype))
+    # Flat values and row splits, which is the disjoint layout of the batch, are computed directly in numpy.
+    # Row splits are valid by construction and do not need to be validated.
+    row_splits = np.zeros(len(numpy_list) + 1, dtype=row_splits_dtype)
+    np.cumsum([len(x) for x in numpy_list], out=row_splits[1:])
+    return tf.RaggedTensor.from_row_splits(
+        np.concatenate(numpy_list, axis=0, dtype=dtype), row_splits, validate=False)
 
 
 def pad_np_array_list_batch_dim(values: list):
@@ -176,3 +180,50 @@ def pad_np_array_list_batch_dim(values: list):
         padded[tuple(index)] = x
         mask[tuple(index)] = True
     return padded, mask
+
+
+def tf_dataset_from_tensors(inputs: list, labels=None, batch_size: int = 32, shuffle: bool = False,
+                            seed: int = None) -> tf.data.Dataset:
+    r"""Make a batched :obj:`tf.data.Dataset` from (ragged) model input tensors of a full dataset, which can be
+    passed to :obj:`tf.keras.Model.fit` without `batch_size` .
+
+    Batches are gathered by index from the full tensors, instead of slicing and batching single graphs.
+    Gathering is done in parallel to the training step via prefetching, so that the next batch is already prepared
+    and copied while the current batch is processed.
+
+    .. code-block:: python
+
+        import numpy as np
+        from kgcnn.data.utils import ragged_tensor_from_nested_numpy, tf_dataset_from_tensors
+        x = ragged_tensor_from_nested_numpy([np.array([[0.0]]), np.array([[1.0], [2.0]]), np.array([[3.0]])])
+        ds = tf_dataset_from_tensors([x], np.array([[0.0], [1.0], [2.0]]), batch_size=2)
+        for x_batch, y_batch in ds:
+            print(x_batch[0].shape, y_batch.shape)
+        # (2, None, 1) (2, 1)
+        # (1, None, 1) (1, 1)
+
+    Args:
+        inputs (list): List of (ragged) tensors of model input with samples in first dimension.
+        labels: Tensor or array of labels with samples in first dimension. Can be None. Default is None.
+        batch_size (int): Size of the batches. Default is 32.
+        shuffle (bool): Whether to shuffle samples in each iteration, i.e. epoch. Default is False.
+        seed (int): Random seed for shuffle. Default is None.
+
+    Returns:
+        tf.data.Dataset: Dataset of batches `(inputs, labels)` or `inputs` , if labels are None.
+    """
+    # Lists in tf.data structures are converted to tensors, therefore tuples are used.
+    inputs = tuple(inputs) if isinstance(inputs, list) else inputs
+    num_samples = len(labels) if labels is not None else int(tf.nest.flatten(inputs)[0].shape[0])
+    indices = tf.data.Dataset.range(num_samples)
+    if shuffle:
+        indices = indices.shuffle(num_samples, seed=seed, reshuffle_each_iteration=True)
+    indices = indices.batch(batch_size)
+
+    def gather_batch(index):
+        x = tf.nest.map_structure(lambda t: tf.gather(t, index, axis=0), inputs)
+        if labels is None:
+            return x
+        return x, tf.gather(labels, index, axis=0)
+
+    return indices.map(gather_batch, num_parallel_calls=tf.data.AUTOTUNE).prefetch(tf.data.AUTOTUNE)
@@ -4,6 +4,7 @@ import logging
 from typing import Union
 from copy import deepcopy
 from kgcnn.data.utils import load_hyper_file, save_json_file
+from kgcnn.utils.config import copy_config
 
 ks = tf.keras
 
@@ -143,7 +144,7 @@ class HyperParameter:
         Returns:
             dict: Deserialized compile kwargs from hyperparameter.
         """
-        hyper_compile = deepcopy(self._hyper["training"]["compile"]) if "compile" in self._hyper["training"] else {}
+        hyper_compile = copy_config(self._hyper["training"]["compile"]) if "compile" in self._hyper["training"] else {}
         if len(hyper_compile) == 0:
             module_logger.warning("Found no information for `compile` in hyperparameter.")
         reserved_compile_arguments = ["loss", "optimizer", "weighted_metrics", "metrics"]
@@ -234,7 +235,7 @@ class HyperParameter:
         Returns:
             dict: de-serialized fit kwargs from hyperparameter.
         """
-        hyper_fit = deepcopy(self._hyper["training"]["fit"])
+        hyper_fit = copy_config(self._hyper["training"]["fit"])
 
         reserved_fit_arguments = ["callbacks", "batch_size", "validation_freq", "epochs"]
         hyper_fit_additional = {key: value for key, value in hyper_fit.items() if key not in reserved_fit_arguments}
@@ -6,6 +6,7 @@ from kgcnn.layers.base import GraphBaseLayer
 from kgcnn.layers.gather import GatherNodesSelection, GatherState
 from kgcnn.layers.modules import LazySubtract, LazyMultiply, LazyAdd
 from kgcnn.ops.axis import get_positive_axis
+from kgcnn.ops.partition import partition_row_indexing
 
 ks = tf.keras
 
@@ -528,6 +529,11 @@ class GaussBasisLayer(GraphBaseLayer):
     :math:`\gamma = \frac{1}{2\sigma^2}`. The Gaussian, or the :math:`\mu_k`, is placed equally
     between :obj:`offset` and :obj:`distance` and the spacing can be defined by the number of :obj:`bins` that is
     simply '(distance-offset)/bins'. The width is controlled by the layer argument :obj:`sigma`.
+
+    .. note::
+
+        The expansion is always computed in `float32` and cast back to the input dtype, so that the basis does not
+        lose precision near zero distance for mixed precision policies like 'mixed_float16' or 'mixed_bfloat16'.
     """
 
     def __init__(self, bins: int = 20, distance: float = 4.0, sigma: float = 0.4, offset: float = 0.0,
@@ -550,8 +556,28 @@ class GaussBasisLayer(GraphBaseLayer):
 
         # Note: For arbitrary axis the code must be adapted.
 
+    def build(self, input_shape):
+        """Build layer."""
+        super(GaussBasisLayer, self).build(input_shape)
+        self._gauss_centers = tf.constant(
+            self._make_gauss_centers(self.bins, self.distance, self.offset), dtype="float32")
+
+    @staticmethod
+    def _make_gauss_centers(bins, distance, offset):
+        r"""Positions of the Gaussian centers :math:`\mu_k` including the offset.
+
+        Args:
+            bins (int): Number of bins for basis.
+            distance (float): Maximum distance to for Gaussian.
+            offset (float): Shift of zero position for basis.
+
+        Returns:
+            np.ndarray: Centers of shape `(bins, )`.
+        """
+        return offset + np.arange(0, bins, 1) / float(bins) * distance
+
     @staticmethod
-    def _compute_gauss_basis(inputs, offset, gamma, bins, distance):
+    def _compute_gauss_basis(inputs, offset, gamma, bins, distance, centers=None):
         r"""Expand into gaussian basis.
 
         Args:
@@ -560,15 +586,23 @@ class GaussBasisLayer(GraphBaseLayer):
             distance (float): Maximum distance to for Gaussian.
             gamma (float): Gamma pre-factor which is :math:`1/(2\sigma^2)` for Gaussian of width :math:`\sigma`.
             offset (float): Shift of zero position for basis.
+            centers (tf.Tensor): Precomputed centers of shape `(bins, )` that already include the offset.
+                If None, the centers are computed from `offset`, `bins` and `distance`. Default is None.
 
         Returns:
             tf.Tensor: Distance tensor expanded in Gaussian.
         """
-        gbs = tf.range(0, bins, 1, dtype=inputs.dtype) / float(bins) * distance
-        out = inputs - offset
-        out = tf.square(out - gbs) * (gamma * (-1.0))
+        dtype = inputs.dtype
+        inputs = tf.cast(inputs, dtype="float32")
+        if centers is None:
+            gbs = tf.range(0, bins, 1, dtype=inputs.dtype) / float(bins) * distance
+            out = inputs - offset
+            out = out - gbs
+        else:
+            out = inputs - tf.cast(centers, dtype=inputs.dtype)
+        out = tf.square(out) * (gamma * (-1.0))
         out = tf.exp(out)
-        return out
+        return tf.cast(out, dtype=dtype)
 
     def call(self, inputs, **kwargs):
         r"""Forward pass.
@@ -583,7 +617,8 @@ class GaussBasisLayer(GraphBaseLayer):
         """
         return self.map_values(
             self._compute_gauss_basis, inputs,
-            offset=self.offset, gamma=self.gamma, bins=self.bins, distance=self.distance)
+            offset=self.offset, gamma=self.gamma, bins=self.bins, distance=self.distance,
+            centers=self._gauss_centers)
 
     def get_config(self):
         """Update config."""
@@ -592,6 +627,82 @@ class GaussBasisLayer(GraphBaseLayer):
         return config
 
 
+@ks.utils.register_keras_serializable(package='kgcnn', name='NodeDistanceGaussBasis')
+class NodeDistanceGaussBasis(GraphBaseLayer):
+    r"""Compute the euclidean distance between the nodes of each edge from node coordinates and expand it into a
+    Gaussian basis in a single layer.
+
+    This is equivalent to :obj:`NodePosition` followed by :obj:`NodeDistanceEuclidean` and :obj:`GaussBasisLayer` ,
+    but operates directly on the flattened values of the ragged input, so that node positions and distances
+    are not created as intermediate ragged tensors. For the arguments of the Gaussian basis,
+    see :obj:`GaussBasisLayer` .
+
+    .. note::
+
+        Coordinates are not auto-cast to the compute dtype of the layer. Distance and Gaussian basis are computed in
+        `float32` and only the output is cast to the compute dtype, e.g. for 'mixed_float16' or 'mixed_bfloat16'.
+    """
+
+    def __init__(self, bins: int = 20, distance: float = 4.0, sigma: float = 0.4, offset: float = 0.0,
+                 **kwargs):
+        r"""Initialize :obj:`NodeDistanceGaussBasis` layer.
+
+        Args:
+            bins (int): Number of bins for basis.
+            distance (float): Maximum distance to for Gaussian.
+            sigma (float): Width of Gaussian for bins.
+            offset (float): Shift of zero position for basis.
+        """
+        kwargs.setdefault("autocast", False)
+        super(NodeDistanceGaussBasis, self).__init__(**kwargs)
+        self.bins = int(bins)
+        self.distance = float(distance)
+        self.offset = float(offset)
+        self.sigma = float(sigma)
+        self.gamma = 1 / sigma / sigma / 2
+        self.node_indexing = "sample"
+
+    def build(self, input_shape):
+        """Build layer."""
+        super(NodeDistanceGaussBasis, self).build(input_shape)
+        self._gauss_centers = tf.constant(
+            GaussBasisLayer._make_gauss_centers(self.bins, self.distance, self.offset), dtype="float32")
+
+    def call(self, inputs, **kwargs):
+        r"""Forward pass.
+
+        Args:
+            inputs (list): [position, edge_index]
+
+                - position (tf.RaggedTensor): Node positions of shape `(batch, [N], 3)`.
+                - edge_index (tf.RaggedTensor): Edge indices referring to nodes of shape `(batch, [M], 2)`.
+
+        Returns:
+            tf.RaggedTensor: Expanded distance. Shape is `(batch, [M], bins)`.
+        """
+        self.assert_ragged_input_rank(inputs)
+        xyz, node_part = tf.cast(inputs[0].values, dtype="float32"), inputs[0].row_splits
+        edge_index, edge_part = inputs[1].values, inputs[1].row_lengths()
+        disjoint_index = partition_row_indexing(edge_index, node_part, edge_part,
+                                                partition_type_target="row_splits",
+                                                partition_type_index="row_length",
+                                                to_indexing='batch',
+                                                from_indexing=self.node_indexing)
+        diff = tf.gather(xyz, disjoint_index[:, 0], axis=0) - tf.gather(xyz, disjoint_index[:, 1], axis=0)
+        dist = EuclideanNorm._compute_euclidean_norm(diff, axis=1, keepdims=True)
+        out = GaussBasisLayer._compute_gauss_basis(
+            dist, offset=self.offset, gamma=self.gamma, bins=self.bins, distance=self.distance,
+            centers=self._gauss_centers)
+        out = tf.cast(out, dtype=self.compute_dtype)
+        return tf.RaggedTensor.from_row_lengths(out, edge_part, validate=self.ragged_validate)
+
+    def get_config(self):
+        """Update config."""
+        config = super(NodeDistanceGaussBasis, self).get_config()
+        config.update({"bins": self.bins, "distance": self.distance, "offset": self.offset, "sigma": self.sigma})
+        return config
+
+
 @ks.utils.register_keras_serializable(package='kgcnn', name='FourierBasisLayer')
 class PositionEncodingBasisLayer(GraphBaseLayer):
     r"""Expand a distance into a Positional Encoding basis from `Transformer <https://arxiv.org/pdf/1706.03762.pdf>`_
@@ -259,9 +259,23 @@ class MLP(MLPBase):
     # If child classes want to replace layers.
     _supress_dense = False
 
-    def __init__(self, units, **kwargs):
-        """Initialize MLP. See MLPBase."""
+    # Normalization layers that require the ragged graph structure and can not run on flat values.
+    _graph_normalization_techniques = ["GraphBatchNormalization", "GraphLayerNormalization", "GraphNormalization",
+                                       "GraphInstanceNormalization"]
+
+    def __init__(self, units, jit_compile: bool = False, **kwargs):
+        """Initialize MLP. See MLPBase.
+
+        Args:
+            jit_compile (bool): Whether to compile the forward pass with XLA. For ragged input, the MLP is applied
+                to the flat values, so that dense, activation and dropout layers are fused, also if the model
+                itself can not be compiled because of ragged tensors. Not used with graph normalization.
+                XLA compiles for each shape of the input. Without normalization, the rows are therefore zero-padded
+                to the next bucket size of the form :math:`2^k` or :math:`1.5 \cdot 2^k` , which limits the number
+                of compiled shapes for varying number of nodes or edges in a batch. Default is False.
+        """
         super(MLP, self).__init__(units=units, **kwargs)
+        self.jit_compile = jit_compile
         norm_classes = {
             "BatchNormalization": ks.layers.BatchNormalization,
             "GraphBatchNormalization": GraphBatchNormalization,
@@ -289,6 +303,12 @@ class MLP(MLPBase):
                 **self._get_conf_for_keys(self._key_dict_norm[self._conf_normalization_technique[i]], "norm", i)
             ) if self._conf_use_normalization[i] else None for i in range(self._depth)
         ]
+        self._use_jit_compile = self.jit_compile and not any(
+            [self._conf_use_normalization[i] and self._conf_normalization_technique[
+                i] in self._graph_normalization_techniques for i in range(self._depth)])
+        self._forward_xla = tf.function(self._forward, jit_compile=True) if self._use_jit_compile else None
+        # Padding rows would change the batch statistics of normalization layers.
+        self._use_jit_padding = self._use_jit_compile and not any(self._conf_use_normalization)
 
     def build(self, input_shape):
         """Build layer."""
@@ -303,6 +323,30 @@ class MLP(MLPBase):
         Returns:
             tf.Tensor: MLP forward pass.
         """
+        if self._use_jit_compile:
+            forward = self._forward_bucket_padded if self._use_jit_padding else self._forward_xla
+            if isinstance(inputs, tf.RaggedTensor):
+                return inputs.with_values(forward(inputs.values, **kwargs))
+            return forward(inputs, **kwargs)
+        return self._forward(inputs, **kwargs)
+
+    @staticmethod
+    def _bucket_length(num_rows):
+        """Round up number of rows to the next bucket size of the form 2^k or 1.5*2^k."""
+        n = tf.cast(tf.maximum(num_rows, 1), dtype="float32")
+        lower = tf.pow(2.0, tf.math.floor(tf.math.log(n) / tf.math.log(2.0)))
+        bucket = tf.where(n <= lower, lower, tf.where(n <= 1.5 * lower, 1.5 * lower, 2.0 * lower))
+        return tf.cast(tf.math.ceil(bucket), dtype=num_rows.dtype)
+
+    def _forward_bucket_padded(self, inputs, **kwargs):
+        """Zero-pad rows to bucket size for the XLA forward pass and remove padded rows from output."""
+        num_rows = tf.shape(inputs)[0]
+        padding = [[0, self._bucket_length(num_rows) - num_rows]] + [[0, 0]] * (inputs.shape.rank - 1)
+        out = self._forward_xla(tf.pad(inputs, padding), **kwargs)
+        return out[:num_rows]
+
+    def _forward(self, inputs, **kwargs):
+        """Apply dense, dropout, normalization and activation layers of all depths."""
         x = inputs
         for i in range(self._depth):
             x = self.mlp_dense_layer_list[i](x, **kwargs)
@@ -317,6 +361,7 @@ class MLP(MLPBase):
     def get_config(self):
         """Update config."""
         config = super(MLP, self).get_config()
+        config.update({"jit_compile": self.jit_compile})
         return config
 
 
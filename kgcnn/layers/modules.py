@@ -65,7 +65,8 @@ class DenseEmbedding(GraphBaseLayer):
                                             bias_regularizer=bias_regularizer,
                                             activity_regularizer=activity_regularizer,
                                             kernel_constraint=kernel_constraint,
-                                            bias_constraint=bias_constraint)
+                                            bias_constraint=bias_constraint,
+                                            dtype=self.dtype_policy)
         self._add_layer_config_to_self = {
             "_layer_dense": ["units", "activation", "use_bias", "kernel_initializer", "bias_initializer",
                              "kernel_regularizer", "bias_regularizer", "activity_regularizer",
@@ -113,7 +114,8 @@ class ActivationEmbedding(GraphBaseLayer):
             activity_regularizer: Regularizer function applied to the output of the layer (its "activation").
         """
         super(ActivationEmbedding, self).__init__(**kwargs)
-        self._layer_act = ks.layers.Activation(activation=activation, activity_regularizer=activity_regularizer)
+        self._layer_act = ks.layers.Activation(activation=activation, activity_regularizer=activity_regularizer,
+                                               dtype=self.dtype_policy)
         self._add_layer_config_to_self = {"_layer_act": ["activation", "activity_regularizer"]}
 
     def call(self, inputs, **kwargs):
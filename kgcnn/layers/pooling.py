@@ -1,7 +1,7 @@
 import tensorflow as tf
 from kgcnn.layers.base import GraphBaseLayer
 from kgcnn.ops.partition import partition_row_indexing
-from kgcnn.ops.segment import segment_ops_by_name, segment_softmax
+from kgcnn.ops.segment import segment_ops_by_name, segment_softmax, segment_weighted_sum, segment_symmetric_pool
 from kgcnn.ops.scatter import tensor_scatter_nd_ops_by_name
 
 ks = tf.keras
@@ -101,6 +101,72 @@ class PoolingLocalEdges(GraphBaseLayer):
 PoolingLocalMessages = PoolingLocalEdges  # For now, they are synonyms
 
 
+@ks.utils.register_keras_serializable(package='kgcnn', name='PoolingSymmetricLocalEdges')
+class PoolingSymmetricLocalEdges(GraphBaseLayer):
+    r"""Pooling layer that aggregates edge embeddings for both nodes of each edge, i.e. for both indices
+    :math:`i` and :math:`j` of the edge index :math:`(i, j)` , and averages the two results.
+
+    This is equivalent to averaging :obj:`PoolingLocalEdges` with `pooling_index=0` and `pooling_index=1` ,
+    but requires only a single (unsorted) segment operation on edges, which are pooled for both directions at once.
+    Nodes without edges in one direction contribute zero for that direction.
+
+    """
+
+    def __init__(self,
+                 pooling_method: str = "mean",
+                 **kwargs):
+        """Initialize layer.
+
+        Args:
+            pooling_method (str): Pooling method to use, either 'mean' or 'sum'. Default is 'mean'.
+        """
+        super(PoolingSymmetricLocalEdges, self).__init__(**kwargs)
+        self.pooling_method = pooling_method
+        self.node_indexing = "sample"
+        if self.pooling_method not in ["mean", "sum"]:
+            raise ValueError("`pooling_method` must be in ['mean', 'sum']")
+
+    def build(self, input_shape):
+        """Build layer."""
+        super(PoolingSymmetricLocalEdges, self).build(input_shape)
+
+    def call(self, inputs, **kwargs):
+        """Forward pass.
+
+        Args:
+            inputs (list): of [node, edges, tensor_index]
+
+                - nodes (tf.RaggedTensor): Node features of shape (batch, [N], F)
+                - edges (tf.RaggedTensor): Edge or message features of shape (batch, [M], F)
+                - tensor_index (tf.RaggedTensor): Edge indices referring to nodes of shape (batch, [M], 2)
+
+        Returns:
+            tf.RaggedTensor: Average of edge features pooled for both node indices of shape (batch, [N], F).
+        """
+        self.assert_ragged_input_rank(inputs)
+
+        nod, node_part = inputs[0].values, inputs[0].row_splits
+        edge, _ = inputs[1].values, inputs[1].row_lengths()
+        edgeind, edge_part = inputs[2].values, inputs[2].row_lengths()
+
+        shiftind = partition_row_indexing(edgeind, node_part, edge_part,
+                                          partition_type_target="row_splits",
+                                          partition_type_index="row_length",
+                                          to_indexing='batch',
+                                          from_indexing=self.node_indexing)
+
+        num_nodes = tf.shape(nod, out_type=shiftind.dtype)[0]
+        out = segment_symmetric_pool(edge, shiftind, num_nodes, pooling_method=self.pooling_method)
+        out = tf.RaggedTensor.from_row_splits(out, node_part, validate=self.ragged_validate)
+        return out
+
+    def get_config(self):
+        """Update layer config."""
+        config = super(PoolingSymmetricLocalEdges, self).get_config()
+        config.update({"pooling_method": self.pooling_method})
+        return config
+
+
 @ks.utils.register_keras_serializable(package='kgcnn', name='PoolingWeightedLocalEdges')
 class PoolingWeightedLocalEdges(GraphBaseLayer):
     r"""The main aggregation or pooling layer to collect all edges or edge-like embeddings per node,
@@ -299,6 +365,14 @@ class PoolingWeightedEmbedding(GraphBaseLayer):
         # We cast to values here
         nod, batchi = inputs[0].values, inputs[0].value_rowids()
         weights, _ = inputs[1].values, inputs[1].value_rowids()
+        if self.pooling_method in ["sum", "mean"] and nod.shape.rank == 2 and weights.shape.rank == 2 and (
+                weights.shape[-1] == 1):
+            # Weighted sum without computing the product of nodes and weights explicitly.
+            out = segment_weighted_sum(nod, weights, batchi, inputs[0].nrows())[:, 0]
+            if self.pooling_method == "mean":
+                out = tf.math.divide_no_nan(
+                    out, tf.cast(tf.expand_dims(inputs[0].row_lengths(), axis=-1), dtype=out.dtype))
+            return out
         nod = tf.math.multiply(nod, weights)
         # Could also use reduce_sum here.
         out = segment_ops_by_name(self.pooling_method, nod, batchi)
@@ -18,7 +18,8 @@ class TestFunctions(unittest.TestCase):
                 [1, 0, 0]
             ])
         ]
-        expected = [0, 1, 1, 0, 0, 0, 0, 1, 0, 0]
+        expected = [0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0]
 
         result = flatten_importances_list(importances_list)
         self.assertListEqual(expected, result)
+        self.assertTrue(all(isinstance(value, float) for value in result))
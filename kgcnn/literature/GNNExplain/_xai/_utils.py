@@ -8,16 +8,17 @@ def flatten_importances_list(importances_list: t.List[np.ndarray],
     """
     Given an ``importances_list`` which is a list of numpy arrays (which may be different shapes), this
     function will flatten all the numpy arrays contained within the list and concatenate all the flattened
-    arrays into a single long list of values.
+    arrays into a single long list of values. The values are always cast to float, independent of the dtype of
+    the given arrays.
 
     Args:
         importances_list: A list of numpy arrays which may have varying shapes.
 
     Returns:
-        A list of all the values within the given arrays, flattened and concatenated in the order given.
+        A list of all the values within the given arrays as python floats, flattened and concatenated in the
+        order given.
     """
-    flattened = []
-    for importances in importances_list:
-        flattened += importances.flatten().tolist()
+    if len(importances_list) == 0:
+        return []
 
-    return flattened
+    return np.concatenate([np.ravel(importances) for importances in importances_list]).astype("float64").tolist()
@@ -127,7 +127,8 @@ def make_model(name: str = None,
     # Nodes must have feature dimension.
     n, n_mask_f = ChangeTensorType(
         output_tensor_type="padded", shape=(None, max_atoms, None))(nd)  # (batch, max_atoms, features)
-    n_mask = MATReduceMask(axis=-1, keepdims=True)(n_mask_f)  # prefer broadcast mask (batch, max_atoms, 1)
+    # Prefer broadcast mask (batch, max_atoms, 1)
+    n_mask = MATReduceMask(axis=-1, keepdims=True, reduce_method="min")(n_mask_f)
     xyz, xyz_mask = ChangeTensorType(output_tensor_type="padded", shape=(None, max_atoms, 3))(xyz_input)
     # Always has shape (batch, max_atoms, max_atoms, 1)
     dist, dist_mask = MATDistanceMatrix(**distance_matrix_kwargs)(
@@ -147,7 +148,7 @@ def make_model(name: str = None,
     if has_edge_dim:
         # Assume that feature-wise attention is not desired for adjacency, reduce to single value.
         adj = ks.layers.Dense(1, use_bias=False)(adj)
-        adj_mask = MATReduceMask(axis=-1, keepdims=True)(adj_mask)
+        adj_mask = MATReduceMask(axis=-1, keepdims=True, reduce_method="min")(adj_mask)
     else:
         # Make sure that shape is (batch, max_atoms, max_atoms, 1).
         adj = MATExpandMask(axis=-1)(adj)
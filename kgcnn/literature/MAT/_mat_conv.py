@@ -48,36 +48,42 @@ class MATDistanceMatrix(ks.layers.Layer):
 
     def build(self, input_shape):
         super(MATDistanceMatrix, self).build(input_shape)
+        # Large value to mask out padded distances. Masking is done in float32.
+        self._large_value = tf.constant(1.0 / ks.backend.epsilon(), dtype="float32")
 
     def call(self, inputs, mask=None, **kwargs):
         r"""Forward pass
 
         Args:
             inputs (tf.Tensor): Padded Coordinates of shape `(batch, N, 3)` .
-            mask (tf.Tensor): Mask of coordinates of similar shape.
+            mask (tf.Tensor): Mask of coordinates of similar shape or node mask of shape `(batch, N, 1)` .
 
         Returns:
             tuple: Distance matrix of shape `(batch, N, N, 1)` plus mask.
         """
         # Shape of inputs (batch, N, 3)
         # Shape of mask (batch, N, 3)
+        # Distance transformation with masking is done in float32 also for mixed precision policies to avoid overflow
+        # of `1/epsilon` and cast to compute dtype at the end.
+        inputs = tf.cast(inputs, dtype="float32")
+        mask = tf.cast(mask, dtype="float32")
         diff = tf.expand_dims(inputs, axis=1) - tf.expand_dims(inputs, axis=2)
         dist = tf.reduce_sum(tf.square(diff), axis=-1, keepdims=True)
         # shape of dist (batch, N, N, 1)
-        diff_mask = tf.expand_dims(mask, axis=1) * tf.expand_dims(mask, axis=2)
-        dist_mask = tf.reduce_prod(diff_mask, axis=-1, keepdims=True)
+        # Mask is binary, for which minimum is equal to product. Reducing the coordinate axis before the pairwise
+        # product avoids a mask of shape (batch, N, N, 3). Also accepts a node mask of shape (batch, N, 1).
+        node_mask = tf.reduce_min(mask, axis=-1, keepdims=True)
+        dist_mask = tf.expand_dims(node_mask, axis=1) * tf.expand_dims(node_mask, axis=2)
 
         if self.trafo == "exp":
-            dist += tf.where(
-                tf.cast(dist_mask, dtype="bool"), tf.zeros_like(dist), tf.ones_like(dist) / ks.backend.epsilon())
+            dist += (1.0 - dist_mask) * self._large_value
             dist = tf.exp(-dist)
         elif self.trafo == "softmax":
-            dist += tf.where(
-                tf.cast(dist_mask, dtype="bool"), tf.zeros_like(dist), -tf.ones_like(dist) / ks.backend.epsilon())
+            dist -= (1.0 - dist_mask) * self._large_value
             dist = tf.nn.softmax(dist, axis=2)
 
         dist = dist * dist_mask
-        return dist, dist_mask
+        return tf.cast(dist, dtype=self.compute_dtype), tf.cast(dist_mask, dtype=self.compute_dtype)
 
     def get_config(self):
         config = super(MATDistanceMatrix, self).get_config()
@@ -88,10 +94,13 @@ class MATDistanceMatrix(ks.layers.Layer):
 @tf.keras.utils.register_keras_serializable(package='kgcnn', name='MATReduceMask')
 class MATReduceMask(ks.layers.Layer):
 
-    def __init__(self, axis: int, keepdims: bool, **kwargs):
+    def __init__(self, axis: int, keepdims: bool, reduce_method: str = "prod", **kwargs):
         super(MATReduceMask, self).__init__(**kwargs)
         self.axis = axis
         self.keepdims = keepdims
+        self.reduce_method = reduce_method
+        if self.reduce_method not in ["prod", "min"]:
+            raise ValueError("`reduce_method` must be in ['prod', 'min']")
 
     def build(self, input_shape):
         super(MATReduceMask, self).build(input_shape)
@@ -103,13 +112,16 @@ class MATReduceMask(ks.layers.Layer):
             inputs (tf.Tensor): Any (mask) Tensor of sufficient rank to reduce for given axis.
 
         Returns:
-            tf.Tensor: Product of inputs along axis.
+            tf.Tensor: Product (or minimum) of inputs along axis.
         """
+        # For binary masks product and minimum are identical, but minimum is cheaper.
+        if self.reduce_method == "min":
+            return tf.reduce_min(inputs, keepdims=self.keepdims, axis=self.axis)
         return tf.reduce_prod(inputs, keepdims=self.keepdims, axis=self.axis)
 
     def get_config(self):
         config = super(MATReduceMask, self).get_config()
-        config.update({"axis": self.axis, "keepdims": self.keepdims})
+        config.update({"axis": self.axis, "keepdims": self.keepdims, "reduce_method": self.reduce_method})
         return config
 
 
@@ -167,6 +179,9 @@ class MATAttentionHead(ks.layers.Layer):
 
     def build(self, input_shape):
         super(MATAttentionHead, self).build(input_shape)
+        # Constants for scaling and masking. Masked softmax is done in float32.
+        self._inv_scale = tf.constant(1.0 / self.scale, dtype=self.compute_dtype)
+        self._neg_large_value = tf.constant(-1.0 / ks.backend.epsilon(), dtype="float32")
 
     def call(self, inputs, mask=None, **kwargs):
         r"""Forward pass.
@@ -181,31 +196,63 @@ class MATAttentionHead(ks.layers.Layer):
         """
         h, a_d, a_g = inputs
         h_mask, a_d_mask, a_g_mask = mask
-        q = tf.expand_dims(self.dense_q(h), axis=2)
-        k = tf.expand_dims(self.dense_k(h), axis=1)
-        v = self.dense_v(h) * h_mask
-        qk = q * k / self.scale
+        # Mask is not auto-cast by keras, which is required for mixed precision policies.
+        h_mask = tf.cast(h_mask, dtype=h.dtype)
+        # Dense layers are applied on flattened nodes of shape (b*N, F), which uses a plain matmul instead of
+        # tensordot with dynamic reshape of padded rank-3 input.
+        h_shape = tf.shape(h)
+        h_flat = tf.reshape(h, [-1, h.shape[-1]])
+        q, k, v = [
+            tf.reshape(layer(h_flat), [h_shape[0], h_shape[1], self.units])
+            for layer in [self.dense_q, self.dense_k, self.dense_v]
+        ]
+        q = tf.expand_dims(q, axis=2)
+        k = tf.expand_dims(k, axis=1)
+        v = v * h_mask
+        qk = q * k * self._inv_scale
+        # Masked softmax is always computed in float32 for numerical stability, e.g. for 'mixed_float16' or
+        # 'mixed_bfloat16' policies. Afterwards attention is cast back to compute dtype for matmul with `v` .
+        qk = tf.cast(qk, dtype="float32")
         # Apply mask on self-attention
         qk_mask = tf.expand_dims(h_mask, axis=1) * tf.expand_dims(h_mask, axis=2)  # (b, 1, n, ...) * (b, n, 1, ...)
-        qk += tf.where(tf.cast(qk_mask, dtype="bool"), tf.zeros_like(qk), -tf.ones_like(qk) / ks.backend.epsilon())
+        qk_mask = tf.cast(qk_mask, dtype="float32")
+        qk += (1.0 - qk_mask) * self._neg_large_value
         qk = tf.nn.softmax(qk, axis=2)
         qk *= qk_mask
+        qk = tf.cast(qk, dtype=h.dtype)
         # Add diagonal to graph adjacency (optional).
+        # Identity is broadcast along batch dimension, which avoids `batch_shape` of `tf.eye` that traces poorly in XLA.
+        # Adjacency is padded to the same number of nodes as `h`, so that the shape of `h` can be reused.
         if self.add_identity:
-            a_g_eye = tf.eye(tf.shape(a_g)[1], batch_shape=tf.shape(a_g)[:1], dtype=a_g.dtype)
+            a_g_eye = tf.eye(h_shape[1], dtype=a_g.dtype)
             if a_g.shape.rank > 3:
                 a_g_eye = tf.expand_dims(a_g_eye, axis=-1)
             a_g += a_g_eye
         # Weights
         qk = self.lambda_attention * qk
-        a_d = self.lambda_distance * tf.cast(a_d, dtype=h.dtype)
-        a_g = self.lambda_adjacency * tf.cast(a_g, dtype=h.dtype)
-        # print(qk.shape, a_d.shape, a_g.shape)
-        att = qk + a_d + a_g
+        # Distance and adjacency term is combined once before adding it to the feature-wise attention.
+        # Bias has shape (b, N, N, 1) for default MAT inputs.
+        bias = self.lambda_distance * tf.cast(a_d, dtype=h.dtype) + self.lambda_adjacency * tf.cast(a_g, dtype=h.dtype)
+        # print(qk.shape, bias.shape)
         # v has shape (b, N, F)
-        # att has shape (b, N, N, F)
         if self._dropout is not None:
-            att = self.layer_dropout(att)
+            # att has shape (b, N, N, F)
+            att = self.layer_dropout(qk + bias)
+            hp = self._contract_attention(att, v)
+        else:
+            # Without dropout on the full attention, the bias is contracted with `v` separately, which avoids
+            # broadcasting it to an additional (b, N, N, F) tensor.
+            hp = self._contract_attention(qk, v) + self._contract_attention(bias, v)
+
+        hp *= h_mask
+        return hp
+
+    @staticmethod
+    def _contract_attention(att, v):
+        r"""Feature-wise product of attention of shape `(b, N, N, F)` with values `v` of shape `(b, N, F)` .
+        Attention with a single (broadcast) feature of shape `(b, N, N, 1)` is reduced to a plain matmul."""
+        if att.shape[-1] == 1:
+            return tf.matmul(tf.squeeze(att, axis=-1), v)
 
         # Or permute feature dimension to batch and apply on last axis via and permute back again
         v = tf.transpose(v, perm=[0, 2, 1])
@@ -217,8 +264,6 @@ class MATAttentionHead(ks.layers.Layer):
         # Same as above but may be slower.
         # hp = tf.einsum('bij...,bjk...->bik...', att, tf.expand_dims(v, axis=2))
         # hp = tf.squeeze(hp, axis=2)
-
-        hp *= h_mask
         return hp
 
     def get_config(self):
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from kgcnn.literature.MAT._mat_conv import MATAttentionHead, MATDistanceMatrix, MATGlobalPool
+
+
+class TestMATLayersGraphMode(unittest.TestCase):
+
+    def random_input(self, num_batches=3, num_nodes=7, num_features=5):
+        h = np.random.normal(size=(num_batches, num_nodes, num_features)).astype("float32")
+        xyz = np.random.normal(size=(num_batches, num_nodes, 3)).astype("float32")
+        adj = np.random.randint(0, 2, size=(num_batches, num_nodes, num_nodes, 1)).astype("float32")
+        # Padded nodes of different length.
+        lengths = np.random.randint(2, num_nodes + 1, size=num_batches)
+        node_mask = (np.arange(num_nodes)[None, :] < lengths[:, None]).astype("float32")
+        h_mask = np.expand_dims(node_mask, axis=-1)
+        xyz_mask = np.repeat(h_mask, 3, axis=-1)
+        adj_mask = np.expand_dims(node_mask[:, :, None] * node_mask[:, None, :], axis=-1)
+        return h * h_mask, xyz * xyz_mask, adj * adj_mask, h_mask, xyz_mask, adj_mask
+
+    def test_trace_dynamic_nodes(self):
+        h, xyz, adj, h_mask, xyz_mask, adj_mask = self.random_input()
+        layer_dist = MATDistanceMatrix()
+        layer_att = MATAttentionHead(units=4, add_identity=True)
+        layer_pool = MATGlobalPool()
+
+        def forward(h_in, xyz_in, adj_in, h_mask_in, xyz_mask_in, adj_mask_in):
+            dist, dist_mask = layer_dist(xyz_in, mask=xyz_mask_in)
+            hp = layer_att([h_in, dist, adj_in], mask=[h_mask_in, dist_mask, adj_mask_in])
+            return layer_pool(hp, mask=h_mask_in)
+
+        expected = forward(h, xyz, adj, h_mask, xyz_mask, adj_mask).numpy()
+
+        f_graph = tf.function(forward, input_signature=[
+            tf.TensorSpec([None, None, 5], tf.float32), tf.TensorSpec([None, None, 3], tf.float32),
+            tf.TensorSpec([None, None, None, 1], tf.float32), tf.TensorSpec([None, None, 1], tf.float32),
+            tf.TensorSpec([None, None, 3], tf.float32), tf.TensorSpec([None, None, None, 1], tf.float32)
+        ])
+        result = f_graph(h, xyz, adj, h_mask, xyz_mask, adj_mask).numpy()
+        self.assertTrue(np.allclose(result, expected, atol=1e-5))
+        # Same trace must work for different number of nodes.
+        result_other = f_graph(*self.random_input(num_nodes=11)).numpy()
+        self.assertTrue(np.all(np.array(result_other.shape) == np.array([3, 4])))
+
+        f_xla = tf.function(forward, jit_compile=True)
+        result_xla = f_xla(h, xyz, adj, h_mask, xyz_mask, adj_mask).numpy()
+        self.assertTrue(np.allclose(result_xla, expected, atol=1e-4))
+
+
+if __name__ == '__main__':
+    unittest.main()
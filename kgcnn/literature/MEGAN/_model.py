@@ -7,22 +7,25 @@ from tensorflow.python.keras.engine import compile_utils
 from kgcnn.layers.base import GraphBaseLayer
 from kgcnn.layers.modules import Dense, OptionalInputEmbedding
 from kgcnn.layers.modules import Activation, Dropout
-from kgcnn.layers.modules import LazyConcatenate, LazyAverage
 from kgcnn.layers.attention import MultiHeadGATV2Layer
-from kgcnn.layers.pooling import PoolingLocalEdges
-from kgcnn.layers.pooling import PoolingWeightedNodes, PoolingNodes
+from kgcnn.layers.pooling import PoolingNodes
+from kgcnn.ops.segment import segment_weighted_sum, segment_symmetric_pool
+from kgcnn.ops.partition import partition_row_indexing
 from kgcnn.literature.GNNExplain._xai._base import ImportanceExplanationMixin
 
 ks = tf.keras
 
 
 def shifted_sigmoid(x, shift=5, multiplier=1):
-    return ks.backend.sigmoid((x - shift) / multiplier)
+    # Constants are resolved in python, so that the graph only has a subtraction (and multiplication) before sigmoid.
+    if multiplier == 1:
+        return ks.backend.sigmoid(x - shift)
+    return ks.backend.sigmoid((x - shift) * (1.0 / multiplier))
 
 
 # Keep track of model version from commit date in literature.
 # To be updated if model is changed in a significant way.
-__model_version__ = "2022.12.15"
+__model_version__ = "2026.10.15"
 
 
 class ExplanationSparsityRegularization(GraphBaseLayer):
@@ -58,6 +61,12 @@ class MEGAN(ks.models.Model, ImportanceExplanationMixin):
     attention-based explanations for that prediction. More specifically, the model outputs node and edge
     attributional explanations (assigning [0, 1] values to ever node / edge of the input graph) in K
     separate explanation channels, where K can be chosen as an independent model parameter.
+
+    Mixed precision is supported by setting a global policy before creating the model, e.g.
+    ``ks.mixed_precision.set_global_policy('mixed_bfloat16')``. Attention and dense layers then run in the
+    compute dtype of the policy, whereas the last layer of the final MLP uses the variable dtype (float32), so
+    that the main model output is in full precision. The node and edge importances are returned in the compute
+    dtype; for the explanation loss they are cast to the dtype of the targets in :meth:`train_step`.
     """
     __kgcnn_model_version__ = __model_version__
 
@@ -173,14 +182,10 @@ class MEGAN(ks.models.Model, ImportanceExplanationMixin):
             self.attention_layers.append(lay)
 
         self.lay_dropout = Dropout(rate=self.dropout_rate)
+        self._use_dropout = self.dropout_rate > 0.0
 
         # ~ EDGE IMPORTANCES
         self.lay_act_importance = Activation(activation=self.importance_activation)
-        self.lay_concat_alphas = LazyConcatenate(axis=-1)
-
-        self.lay_pool_edges_in = PoolingLocalEdges(pooling_method='mean', pooling_index=0)
-        self.lay_pool_edges_out = PoolingLocalEdges(pooling_method='mean', pooling_index=1)
-        self.lay_average = LazyAverage()
 
         # ~ NODE IMPORTANCES
         self.node_importance_units = importance_units + [self.importance_channels]
@@ -198,19 +203,22 @@ class MEGAN(ks.models.Model, ImportanceExplanationMixin):
 
         # ~ OUTPUT / MLP TAIL END
         self.lay_pool_out = PoolingNodes(pooling_method=self.final_pooling)
-        self.lay_concat_out = LazyConcatenate(axis=-1)
         self.lay_final_dropout = Dropout(rate=self.final_dropout_rate)
+        self._use_final_dropout = self.final_dropout_rate > 0.0
 
         self.final_acts = ["relu" for _ in self.final_units]
         self.final_acts[-1] = self.final_activation
         self.final_biases = [True for _ in self.final_units]
         self.final_biases[-1] = False
         self.final_layers = []
-        for u, act, bias in zip(self.final_units, self.final_acts, self.final_biases):
+        for i, (u, act, bias) in enumerate(zip(self.final_units, self.final_acts, self.final_biases)):
+            is_last = i == len(self.final_units) - 1
             lay = Dense(
                 units=u,
                 activation=act,
-                use_bias=use_bias
+                use_bias=use_bias,
+                # For mixed precision, the output layer must compute in the variable dtype of the policy.
+                dtype=ks.mixed_precision.global_policy().variable_dtype if is_last else None
             )
             self.final_layers.append(lay)
 
@@ -267,32 +275,37 @@ class MEGAN(ks.models.Model, ImportanceExplanationMixin):
         if self.input_embedding:
             node_input = self.embedding_nodes(node_input, training=training)
         # First of all we apply all the graph convolutional / attention layers. Each of those layers outputs
-        # the attention logits alpha additional to the node embeddings. We collect all the attention logits
-        # in a list so that we can later sum them all up.
-        alphas = []
+        # the attention logits alpha additional to the node embeddings. We directly sum up all the attention
+        # logits (on the values of the ragged tensors), which avoids to keep all of them for concatenation.
+        alpha_sum = None
         x = node_input
         for lay in self.attention_layers:
             # x: ([batch], [N], F)
             # alpha: ([batch], [M], K, 1)
             x, alpha = lay([x, edge_input, edge_index_input])
-            if training:
+            if training and self._use_dropout:
                 x = self.lay_dropout(x, training=training)
 
-            alphas.append(alpha)
+            alpha_sum = alpha.values[..., 0] if alpha_sum is None else alpha_sum + alpha.values[..., 0]
 
-        # We sum up all the individual layers attention logit tensors and the edge importances are directly
-        # calculated by applying a sigmoid on that sum.
-        alphas = self.lay_concat_alphas(alphas)
-        edge_importances = tf.reduce_sum(alphas, axis=-1, keepdims=False)
+        # The edge importances are directly calculated by applying a sigmoid on the sum of all the individual
+        # layers attention logit tensors.
+        # edge_importances: ([batch], [M], K)
+        edge_importances = tf.RaggedTensor.from_row_splits(alpha_sum, alpha.row_splits, validate=False)
         edge_importances = self.lay_act_importance(edge_importances)
 
         # Part of the final node importance tensor is actually the pooled edge importances, so that is what
         # we are doing here. The caveat here is that we assume undirected edges as two directed edges in
         # opposing direction. To now achieve a symmetric pooling of these edges we have to pool in both
-        # directions and then use the average of both.
-        pooled_edges_in = self.lay_pool_edges_in([node_input, edge_importances, edge_index_input])
-        pooled_edges_out = self.lay_pool_edges_out([node_input, edge_importances, edge_index_input])
-        pooled_edges = self.lay_average([pooled_edges_out, pooled_edges_in])
+        # directions and then use the average of both. This is done by a single segment mean directly on the
+        # flat values with `segment_symmetric_pool`, without the overhead of a separate layer call.
+        # pooled_edges: (N_total, K)
+        disjoint_index = partition_row_indexing(
+            edge_index_input.values, x.row_splits, edge_index_input.row_lengths(),
+            partition_type_target="row_splits", partition_type_index="row_length",
+            to_indexing="batch", from_indexing="sample")
+        num_nodes = tf.shape(x.values, out_type=disjoint_index.dtype)[0]
+        pooled_edges = segment_symmetric_pool(edge_importances.values, disjoint_index, num_nodes, pooling_method="mean")
 
         node_importances_tilde = x
         for lay in self.node_importance_layers:
@@ -300,32 +313,25 @@ class MEGAN(ks.models.Model, ImportanceExplanationMixin):
 
         node_importances_tilde = self.lay_act_importance(node_importances_tilde)
 
-        node_importances = node_importances_tilde * pooled_edges
+        node_importances = tf.RaggedTensor.from_row_splits(
+            node_importances_tilde.values * pooled_edges, node_importances_tilde.row_splits, validate=False)
         self.lay_sparsity(node_importances)
 
         # Here we apply the global pooling. It is important to note that we do K separate pooling operations
         # were each time we use the same node embeddings x but a different slice of the node importances as
-        # the weights! We concatenate all the individual results in the end.
-        outs = []
-        for k in range(self.importance_channels):
-            node_importance_slice = tf.expand_dims(node_importances[:, :, k], axis=-1)
-            out = self.lay_pool_out(x * node_importance_slice)
-
-            outs.append(out)
-
+        # the weights! All K pooling operations are done at once, see `_pool_importance_channels` .
         # out: ([batch], F*K)
-        out = self.lay_concat_out(outs)
+        out = self._pool_importance_channels(x, node_importances)
 
         # Now "out" is a graph embedding vector of known dimension so we can simply apply the normal dense
         # mlp to get the final output value.
         for lay in self.final_layers:
             out = lay(out)
-            if training:
-                self.lay_final_dropout(out, training=training)
+            if training and self._use_final_dropout:
+                out = self.lay_final_dropout(out, training=training)
 
         if self.doing_regression:
-            reference = tf.ones_like(out) * self.regression_reference
-            out = out + reference
+            out = out + tf.cast(self.regression_reference, dtype=out.dtype)
 
         # Usually, the node and edge importance tensors would be direct outputs of the model as well, but
         # we need the option to just return the output alone to be compatible with the standard model
@@ -335,33 +341,64 @@ class MEGAN(ks.models.Model, ImportanceExplanationMixin):
         else:
             return out
 
+    def _pool_importance_channels(self, x: tf.RaggedTensor, node_importances: tf.RaggedTensor) -> tf.Tensor:
+        """
+        Pools the node embeddings ([B], [N], F) weighted with each of the K channels of the node importances
+        ([B], [N], K) and returns the concatenated results of shape ([B], K*F) in the order of the channels.
+
+        For 'sum' and 'mean' pooling, this is a sparse-dense matrix multiplication of a (K*B, N_total) sparse
+        matrix holding the node importances with the flat node embeddings (N_total, F), which avoids to
+        materialize the weighted embeddings of shape (N_total, K, F). Other pooling methods weight the node
+        embeddings for all K channels via broadcasting and pool them in a single operation.
+        """
+        num_channels = self.importance_channels
+        num_features = x.shape[-1]
+        if self.final_pooling not in ["sum", "mean"]:
+            x_weighted = tf.expand_dims(node_importances.values, axis=-1) * tf.expand_dims(x.values, axis=-2)
+            x_weighted = tf.reshape(x_weighted, [-1, num_channels * num_features])
+            x_weighted = tf.RaggedTensor.from_row_splits(x_weighted, x.row_splits, validate=False)
+            return self.lay_pool_out(x_weighted)
+
+        # out: (B, K, F) -> (B, K*F)
+        out = segment_weighted_sum(x.values, node_importances.values, x.value_rowids(), x.nrows())
+        out = tf.reshape(out, [-1, num_channels * num_features])
+        if self.final_pooling == "mean":
+            out = tf.math.divide_no_nan(out, tf.cast(tf.expand_dims(x.row_lengths(), axis=-1), dtype=out.dtype))
+        return out
+
+    @tf.function(jit_compile=True)
     def regression_augmentation(self,
                                 out_true: tf.RaggedTensor):
         """
         Given the tensor ([B], 1) of true regression target values, this method will return two derived
         tensors: The first one is a ([B], 2) tensor of normalized distances of the corresponding true
         values to ``self.regression_reference`` and the second is a ([B], 2) boolean mask tensor.
+
+        This method only consists of element-wise operations on dense tensors and is therefore compiled with XLA
+        into a single fused kernel, also if the (ragged) training step itself can not be compiled.
+
         Args:
             out_true: A tensor of shape ([B], 1) of the true target values of the current batch.
         Returns:
             A tuple of two tensors each with the shape ([B], 2)
         """
-        center_distances = tf.abs(out_true - self.regression_reference)
-        center_distances = (center_distances * self.importance_multiplier) / (
-                0.5 * self.regression_width)
+        # Single pass over targets: The signed distance to the reference gives both the normalized distances
+        # and the masks. The normalization factor is a python float, that is folded into one multiplication.
+        signed_distances = out_true - self.regression_reference
+        center_distances = tf.abs(signed_distances) * (self.importance_multiplier / (0.5 * self.regression_width))
 
         # So we need two things: a "samples" tensor and a "mask" tensor. We are going to use the samples
         # tensor as the actual ground truth which acts as the regression target during the explanation
         # train step. The binary values of the mask will determine at which positions a loss should
         # actually be calculated for both of the channels
-
-        # The "lower" part is all the samples which have a target value below the reference value.
-        lo_mask = tf.where(out_true < self.regression_reference, 1.0, 0.0)
-        # The "higher" part all of the samples above reference
-        hi_mask = tf.where(out_true > self.regression_reference, 1.0, 0.0)
-
         samples = tf.concat([center_distances, center_distances], axis=-1)
-        mask = tf.concat([lo_mask, hi_mask], axis=-1)
+
+        # The "lower" part is all the samples which have a target value below the reference value and the
+        # "higher" part all of the samples above reference.
+        mask = tf.concat([
+            tf.cast(signed_distances < 0, dtype=center_distances.dtype),
+            tf.cast(signed_distances > 0, dtype=center_distances.dtype)
+        ], axis=-1)
 
         return samples, mask
 
@@ -410,17 +447,12 @@ class MEGAN(ks.models.Model, ImportanceExplanationMixin):
                 # ~ explanation loss
                 # First of all we need to assemble the approximated model output, which is simply calculated
                 # by applying a global pooling operation on the corresponding slice of the node importances.
-                # So for each slice (each importance channel) we get a single value, which we then
-                # concatenate into an output vector with K dimensions.
-                outs = []
-                for k in range(self.importance_channels):
-                    node_importances_slice = tf.expand_dims(ni_pred[:, :, k], axis=-1)
-                    out = self.lay_pool_out(node_importances_slice)
-
-                    outs.append(out)
-
+                # So for each slice (each importance channel) we get a single value, which gives an output
+                # vector with K dimensions. Since pooling acts on each channel independently, this is done
+                # in a single pooling operation over all channels. Under a mixed precision policy the importances
+                # are in the compute dtype, so they are cast to the dtype of the targets here.
                 # outs: ([batch], K)
-                outs = self.lay_concat_out(outs)
+                outs = tf.cast(self.lay_pool_out(ni_pred), out_true.dtype)
 
                 if self.doing_regression:
                     out_true, mask = self.regression_augmentation(out_true)
@@ -13,11 +13,6 @@ import matplotlib.pyplot as plt
 from kgcnn.literature.MEGAN import MEGAN
 from kgcnn.literature.MEGAN import shifted_sigmoid
 
-try:
-    from .utils import ASSETS_PATH
-except:
-    ASSETS_PATH = ""
-
 ks = tf.keras
 # mpl.use('TkAgg')
 mpl.use('Agg')
@@ -57,8 +52,12 @@ class TestMegan(unittest.TestCase):
         ax.plot(xs, shifted_sigmoid(xs, multiplier=3), label='multiplier: 3')
         ax.legend()
 
-        pdf_path = os.path.join(ASSETS_PATH, 'megan_shifted_sigmoid.pdf')
-        fig.savefig(pdf_path)
+        # The plot is only written to a temporary folder, so that running the test leaves no files behind.
+        with tempfile.TemporaryDirectory() as path:
+            pdf_path = os.path.join(path, 'megan_shifted_sigmoid.pdf')
+            fig.savefig(pdf_path)
+            self.assertTrue(os.path.exists(pdf_path))
+        plt.close(fig)
 
     def test_shifted_sigmoid_setting_rules(self):
         fig, ax = plt.subplots(ncols=1, nrows=1, figsize=(10, 10))
@@ -70,8 +69,11 @@ class TestMegan(unittest.TestCase):
         ax.plot(xs, shifted_sigmoid(xs, shift=15, multiplier=3), label='shift: 15')
         ax.legend()
 
-        pdf_path = os.path.join(ASSETS_PATH, 'megan_shifted_sigmoid_setting_rules.pdf')
-        fig.savefig(pdf_path)
+        with tempfile.TemporaryDirectory() as path:
+            pdf_path = os.path.join(path, 'megan_shifted_sigmoid_setting_rules.pdf')
+            fig.savefig(pdf_path)
+            self.assertTrue(os.path.exists(pdf_path))
+        plt.close(fig)
 
     def test_construction_basically_works(self):
         model = MEGAN(units=[1])
@@ -100,6 +102,23 @@ class TestMegan(unittest.TestCase):
             self.assertEqual((num_batches, None, num_channels), node_importances.shape)
             self.assertEqual((num_batches, None, num_channels), node_importances.shape)
 
+    def test_pool_importance_channels_matches_loop(self):
+        n, e, ei = self.random_input(num_batches=5, num_features=3)
+        num_channels = 3
+        importances = tf.RaggedTensor.from_row_splits(
+            tf.random.uniform((tf.shape(n.values)[0], num_channels)), n.row_splits)
+
+        for pooling in ['sum', 'mean', 'max']:
+            model = MEGAN(units=[3], importance_channels=num_channels, final_pooling=pooling)
+            out = model._pool_importance_channels(n, importances)
+
+            expected = tf.concat([
+                model.lay_pool_out(n * tf.expand_dims(importances[:, :, k], axis=-1))
+                for k in range(num_channels)
+            ], axis=-1)
+            self.assertEqual((5, num_channels * 3), out.shape)
+            np.testing.assert_allclose(out.numpy(), expected.numpy(), rtol=1e-5, atol=1e-6)
+
     def test_saving_loading_basically_works(self):
         num_batches = 5
         num_features = 3
@@ -188,3 +207,31 @@ class TestMegan(unittest.TestCase):
         self.assertIn('exp_loss', history.history)
         self.assertNotEqual(0.0, history.history['exp_loss'])
 
+    def test_explanation_training_mixed_bfloat16(self):
+        num_batches = 4
+        num_features = 3
+        n, e, eid = self.random_input(num_batches=num_batches, num_features=num_features)
+        out = np.array([[random.random()] for _ in range(num_batches)], dtype="float32")
+
+        ks.mixed_precision.set_global_policy('mixed_bfloat16')
+        try:
+            model = MEGAN(
+                units=[5, 3],
+                activation='relu',
+                importance_channels=2,
+                final_units=[1],
+                return_importances=False,
+                importance_factor=1.0,
+                regression_limits=(-1, 1),
+                regression_reference=0
+            )
+            model.compile(
+                optimizer='adam',
+                loss=ks.losses.mean_squared_error
+            )
+            result = model.train_on_batch([n, e, eid], out, return_dict=True)
+        finally:
+            ks.mixed_precision.set_global_policy('float32')
+
+        self.assertIn('exp_loss', result)
+        self.assertTrue(np.isfinite(result['loss']))
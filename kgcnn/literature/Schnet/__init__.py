@@ -1,10 +1,12 @@
 from ._make import make_model, model_default
 from ._make import make_crystal_model, model_crystal_default
+from ._tflite import to_tflite_int8
 
 
 __all__ = [
     "make_model",
     "model_default",
     "make_crystal_model",
-    "model_crystal_default"
+    "model_crystal_default",
+    "to_tflite_int8"
 ]
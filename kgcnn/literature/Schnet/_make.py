@@ -1,7 +1,8 @@
 import tensorflow as tf
 from kgcnn.layers.casting import ChangeTensorType
 from ._schnet_conv import SchNetInteraction
-from kgcnn.layers.geom import NodeDistanceEuclidean, GaussBasisLayer, NodePosition, ShiftPeriodicLattice
+from kgcnn.layers.geom import NodeDistanceEuclidean, GaussBasisLayer, NodePosition, ShiftPeriodicLattice, \
+    NodeDistanceGaussBasis
 from kgcnn.layers.modules import Dense, OptionalInputEmbedding
 from kgcnn.layers.mlp import GraphMLP, MLP
 from kgcnn.layers.pooling import PoolingNodes
@@ -63,6 +64,10 @@ def make_model(inputs: list = None,
     r"""Make `SchNet <https://arxiv.org/abs/1706.08566>`_ graph network via functional API.
     Default parameters can be found in :obj:`kgcnn.literature.Schnet.model_default`.
 
+    Mixed precision is supported by setting a global policy before making the model, e.g.
+    :obj:`ks.mixed_precision.set_global_policy('mixed_bfloat16')` . The Gaussian distance expansion is then still
+    computed in `float32` and the model output is cast back to `float32` .
+
     Inputs:
         list: `[node_attributes, edge_distance, edge_indices]`
         or `[node_attributes, node_coordinates, edge_indices]` if :obj:`make_distance=True` and
@@ -111,15 +116,19 @@ def make_model(inputs: list = None,
                                use_embedding=len(inputs[0]['shape']) < 2)(node_input)
     edi = edge_index_input
 
-    if make_distance:
-        x = xyz_input
-        pos1, pos2 = NodePosition()([x, edi])
-        ed = NodeDistanceEuclidean()([pos1, pos2])
+    if make_distance and expand_distance:
+        # Distance and gauss expansion from coordinates in a single layer.
+        ed = NodeDistanceGaussBasis(**gauss_args)([xyz_input, edi])
     else:
-        ed = xyz_input
+        if make_distance:
+            x = xyz_input
+            pos1, pos2 = NodePosition()([x, edi])
+            ed = NodeDistanceEuclidean()([pos1, pos2])
+        else:
+            ed = xyz_input
 
-    if expand_distance:
-        ed = GaussBasisLayer(**gauss_args)(ed)
+        if expand_distance:
+            ed = GaussBasisLayer(**gauss_args)(ed)
 
     # Model
     n = Dense(interaction_args["units"], activation='linear')(n)
@@ -142,6 +151,11 @@ def make_model(inputs: list = None,
     else:
         raise ValueError("Unsupported output embedding for mode `SchNet`")
 
+    # For mixed precision policies like 'mixed_bfloat16' the model output is cast back to the variable dtype.
+    policy = ks.mixed_precision.global_policy()
+    if policy.compute_dtype != policy.variable_dtype and (output_embedding == "graph" or output_to_tensor):
+        out = ks.layers.Activation("linear", dtype=policy.variable_dtype)(out)
+
     model = ks.models.Model(inputs=[node_input, xyz_input, edge_index_input], outputs=out)
 
     model.__kgcnn_model_version__ = __model_version__
@@ -276,6 +290,11 @@ def make_crystal_model(inputs: list = None,
     else:
         raise ValueError("Unsupported output embedding for mode `SchNet`")
 
+    # For mixed precision policies like 'mixed_bfloat16' the model output is cast back to the variable dtype.
+    policy = ks.mixed_precision.global_policy()
+    if policy.compute_dtype != policy.variable_dtype and (output_embedding == "graph" or output_to_tensor):
+        out = ks.layers.Activation("linear", dtype=policy.variable_dtype)(out)
+
     model = ks.models.Model(inputs=[node_input, xyz_input, edge_index_input, edge_image, lattice], outputs=out)
 
     model.__kgcnn_model_version__ = __model_version__
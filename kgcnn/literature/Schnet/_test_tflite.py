@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from kgcnn.literature.Schnet import make_model, to_tflite_int8
+from kgcnn.literature.Schnet._tflite import _flatten_model_inputs
+
+
+class TestSchnetTFLite(unittest.TestCase):
+
+    def random_input(self, num_nodes):
+        nodes = tf.ragged.constant([np.random.randint(1, 10, size=num_nodes).astype("float32")], ragged_rank=1)
+        xyz = tf.ragged.constant([np.random.normal(size=(num_nodes, 3)).astype("float32")], ragged_rank=1,
+                                 inner_shape=(3,))
+        edge_indices = np.array([[i, j] for i in range(num_nodes) for j in range(num_nodes) if i != j], dtype="int64")
+        edge_indices = tf.ragged.constant([edge_indices], ragged_rank=1, inner_shape=(2,), dtype="int64")
+        return [nodes, xyz, edge_indices]
+
+    def test_to_tflite_int8(self):
+        model = make_model(
+            input_embedding={"node": {"input_dim": 10, "output_dim": 8}},
+            interaction_args={"units": 8, "use_bias": True, "activation": "kgcnn>shifted_softplus",
+                              "cfconv_pool": "sum"},
+            depth=1,
+            gauss_args={"bins": 4, "distance": 4, "offset": 0.0, "sigma": 0.4},
+            last_mlp={"use_bias": [True], "units": [8], "activation": ["kgcnn>shifted_softplus"]},
+            output_mlp={"use_bias": [True], "units": [1], "activation": ["linear"]},
+            verbose=0
+        )
+        samples = [self.random_input(3), self.random_input(4)]
+
+        def representative_dataset():
+            for x in samples:
+                yield x
+
+        tflite_model = to_tflite_int8(model, representative_dataset)
+        self.assertIsInstance(tflite_model, bytes)
+
+        interpreter = tf.lite.Interpreter(model_content=tflite_model)
+        runner = interpreter.get_signature_runner()
+        flat_inputs = _flatten_model_inputs(samples[0])
+        self.assertEqual(len(interpreter.get_input_details()), len(flat_inputs))
+        result = runner(**{"input_%s" % i: x.numpy() for i, x in enumerate(flat_inputs)})
+        result = list(result.values())[0]
+        self.assertEqual(result.shape, (1, 1))
+        self.assertTrue(np.all(np.isfinite(result)))
+
+
+if __name__ == '__main__':
+    unittest.main()
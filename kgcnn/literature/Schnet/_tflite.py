@@ -0,0 +1,79 @@
+import tensorflow as tf
+
+ks = tf.keras
+
+
+def _flatten_model_inputs(inputs: list) -> list:
+    r"""Flatten a list of (ragged) model inputs into plain tensors, i.e. values and row splits for ragged tensors."""
+    flat_inputs = []
+    for x in inputs:
+        if isinstance(x, tf.RaggedTensor):
+            flat_inputs += [x.values, x.row_splits]
+        else:
+            flat_inputs.append(x)
+    return flat_inputs
+
+
+def to_tflite_int8(model: ks.models.Model, representative_dataset, input_signature: list = None) -> bytes:
+    r"""Convert a :obj:`SchNet` model into a TFLite model with post-training int8 quantization.
+
+    TFLite does not accept ragged tensors as model inputs. Therefore, the model is traced with each ragged input
+    given as flat values and row splits, from which the ragged tensors are rebuilt within the graph.
+    The converted model has a single signature with the flat inputs named `input_0` , `input_1` , ... in the order
+    `[node_attributes_values, node_attributes_row_splits, node_coordinates_values, node_coordinates_row_splits,
+    edge_indices_values, edge_indices_row_splits]` . The order of the raw input tensors of the interpreter can
+    differ, so the inputs should be passed by name via :obj:`tf.lite.Interpreter.get_signature_runner` .
+
+    Weights and activations are quantized to int8 for ops that have int8 kernels, which are mostly the
+    :obj:`Dense` layers of the interaction blocks and the final MLP. The remaining ops like the distance
+    computation, the Gaussian expansion and the segment pooling are kept in float.
+
+    Args:
+        model (ks.models.Model): Keras SchNet model from :obj:`make_model` .
+        representative_dataset: Callable that returns a generator of model inputs in keras form, i.e. a list of
+            (ragged) tensors like `[node_attributes, node_coordinates, edge_indices]` , used for calibration.
+        input_signature (list): List of :obj:`tf.TensorSpec` or :obj:`tf.RaggedTensorSpec` for the model inputs.
+            If None, the type specs of the model inputs are used. Default is None.
+
+    Returns:
+        bytes: Serialized TFLite model.
+    """
+    if input_signature is None:
+        input_signature = [x.type_spec for x in model.inputs]
+
+    flat_signature = []
+    for spec in input_signature:
+        if isinstance(spec, tf.RaggedTensorSpec):
+            flat_signature += [
+                tf.TensorSpec(shape=[None] + spec.shape[2:].as_list(), dtype=spec.dtype),
+                tf.TensorSpec(shape=[None], dtype=spec.row_splits_dtype)]
+        else:
+            flat_signature.append(spec)
+    # Inputs of the TFLite signature are matched by name and not by position.
+    flat_signature = [tf.TensorSpec(shape=x.shape, dtype=x.dtype, name="input_%s" % i)
+                      for i, x in enumerate(flat_signature)]
+
+    @tf.function(input_signature=flat_signature)
+    def model_inference(*args):
+        inputs, i = [], 0
+        for spec in input_signature:
+            if isinstance(spec, tf.RaggedTensorSpec):
+                inputs.append(tf.RaggedTensor.from_row_splits(args[i], args[i + 1], validate=False))
+                i += 2
+            else:
+                inputs.append(args[i])
+                i += 1
+        return model(inputs, training=False)
+
+    def flat_representative_dataset():
+        for inputs in representative_dataset():
+            yield {spec.name: x for spec, x in zip(flat_signature, _flatten_model_inputs(inputs))}
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions(
+        [model_inference.get_concrete_function()], model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = flat_representative_dataset
+    # Fall back to float kernels for ops without int8 implementation.
+    converter.target_spec.supported_ops = [
+        tf.lite.OpsSet.TFLITE_BUILTINS_INT8, tf.lite.OpsSet.TFLITE_BUILTINS, tf.lite.OpsSet.SELECT_TF_OPS]
+    return converter.convert()
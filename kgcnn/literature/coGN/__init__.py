@@ -83,7 +83,7 @@ Molecules
 
 from ._make import make_model, make_force_model
 from ._coGN_config import (model_default, crystal_asymmetric_unit_graphs, molecular_graphs, crystal_unit_graphs,
-                           crystal_unit_graphs_coord_input, molecular_graphs_coord_input)
+                           crystal_unit_graphs_coord_input, molecular_graphs_coord_input, get_model_config)
 from ._coNGN_config import model_default_nested
 
 
@@ -96,5 +96,6 @@ __all__ = [
     "crystal_unit_graphs_coord_input",
     "molecular_graphs",
     "molecular_graphs_coord_input",
+    "get_model_config",
     "model_default_nested"
 ]
@@ -1,4 +1,8 @@
-from copy import deepcopy
+from kgcnn.utils.config import copy_config
+
+# Block configs are shared by reference between the model configs below, since they are only read.
+# `update_model_kwargs` makes a single deep copy of the default config for each model that is made.
+# Use `get_model_config` for a copy of a config that can be modified.
 
 units = 128
 depth = 5
@@ -16,6 +20,8 @@ input_block_cfg = {'node_size': units,
                                            'bins_voronoi_area': None,
                                            'max_voronoi_area': None}}
 
+# The MLPs of the processing blocks can be compiled with XLA on the flat values of the ragged edges and nodes by
+# setting `'jit_compile': True` for 'edge_mlp' and 'node_mlp' , e.g. in the model config of the hyperparameter.
 processing_block_cfg = {'edge_mlp': {'units': [units] * 5,
                                      'activation': ['swish'] * 5},
                         'node_mlp': {'units': [units] * 1,
@@ -71,26 +77,27 @@ output_block_cfg = {'edge_mlp': None,
                     'update_global_input': [False, True, False],
                     'multiplicity_readout': True}
 
-output_block_cfg_no_multiplicity = deepcopy(output_block_cfg)
-output_block_cfg_no_multiplicity['multiplicity_readout'] = False
+output_block_cfg_no_multiplicity = {**output_block_cfg, 'multiplicity_readout': False}
 
 
+# Atomic numbers (Z <= 118) and multiplicities (<= 192) are passed as narrow integer types, which reduces memory
+# and transfer of the inputs. They are cast to int32 for embedding and to float for readout within the model.
 crystal_asymmetric_unit_graphs = {
     "inputs": {
         "offset": {"shape": (None, 3), "name": "offset", "dtype": "float32", "ragged": True},
         "cell_translation": None,
         "affine_matrix": None,
         "voronoi_ridge_area": None,
-        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int32", "ragged": True},
+        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int8", "ragged": True},
         "frac_coords": None,
         "coords": None,
-        "multiplicity": {"shape": (None, ), "name": "multiplicity", "dtype": "int32", "ragged": True},
+        "multiplicity": {"shape": (None, ), "name": "multiplicity", "dtype": "int16", "ragged": True},
         "lattice_matrix": None,
         "edge_indices": {"shape": (None, 2), "name": "edge_indices", "dtype": "int32", "ragged": True},
         "line_graph_edge_indices": None,
     },
     "input_block_cfg": input_block_cfg,
-    "processing_blocks_cfg": [deepcopy(processing_block_cfg) for _ in range(depth)],
+    "processing_blocks_cfg": [processing_block_cfg] * depth,
     "output_block_cfg": output_block_cfg,
 }
 
@@ -100,7 +107,7 @@ crystal_unit_graphs = {
         "cell_translation": None,
         "affine_matrix": None,
         "voronoi_ridge_area": None,
-        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int32", "ragged": True},
+        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int8", "ragged": True},
         "frac_coords": None,
         "coords": None,
         "multiplicity": None,
@@ -109,7 +116,7 @@ crystal_unit_graphs = {
         "line_graph_edge_indices": None,
     },
     "input_block_cfg": input_block_cfg,
-    "processing_blocks_cfg": [deepcopy(processing_block_cfg) for _ in range(depth)],
+    "processing_blocks_cfg": [processing_block_cfg] * depth,
     "output_block_cfg": output_block_cfg_no_multiplicity,
 }
 molecular_graphs = crystal_unit_graphs
@@ -120,7 +127,7 @@ crystal_unit_graphs_coord_input = {
         "cell_translation": {"shape": (None,3), "dtype": "float32", "name": "cell_translation", "ragged": True},
         "affine_matrix": None,
         "voronoi_ridge_area": None,
-        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int32", "ragged": True},
+        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int8", "ragged": True},
         "frac_coords": {"shape": (None,3), "dtype": "float32", "name": "frac_coords", "ragged": True},
         "coords": None,
         "multiplicity": None,
@@ -129,7 +136,7 @@ crystal_unit_graphs_coord_input = {
         "line_graph_edge_indices": None,
     },
     "input_block_cfg": input_block_cfg,
-    "processing_blocks_cfg": [deepcopy(processing_block_cfg) for _ in range(depth)],
+    "processing_blocks_cfg": [processing_block_cfg] * depth,
     "output_block_cfg": output_block_cfg_no_multiplicity,
 }
 
@@ -139,7 +146,7 @@ molecular_graphs_coord_input = {
         "cell_translation": None,
         "affine_matrix": None,
         "voronoi_ridge_area": None,
-        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int32", "ragged": True},
+        "atomic_number": {"shape": (None,), "name": "atomic_number", "dtype": "int8", "ragged": True},
         "frac_coords": None,
         "coords": {"shape": (None,3), "dtype": "float32", "name": "coords", "ragged": True},
         "multiplicity": None,
@@ -148,8 +155,29 @@ molecular_graphs_coord_input = {
         "line_graph_edge_indices": None,
     },
     "input_block_cfg": input_block_cfg,
-    "processing_blocks_cfg": [deepcopy(processing_block_cfg) for _ in range(depth)],
+    "processing_blocks_cfg": [processing_block_cfg] * depth,
     "output_block_cfg": output_block_cfg_no_multiplicity,
 }
 
 model_default = crystal_asymmetric_unit_graphs
+
+
+def get_model_config(name: str = "model_default") -> dict:
+    r"""Get a copy of a model config of this module by name, e.g. 'crystal_unit_graphs' , which can be modified.
+
+    The model configs of this module share their block configs by reference and must only be read. The copy has
+    independent block configs, also for each of the processing blocks.
+
+    Args:
+        name (str): Name of the model config. Default is 'model_default'.
+
+    Returns:
+        dict: Copy of the model config.
+    """
+    configs = {"model_default": model_default, "crystal_asymmetric_unit_graphs": crystal_asymmetric_unit_graphs,
+               "crystal_unit_graphs": crystal_unit_graphs, "molecular_graphs": molecular_graphs,
+               "crystal_unit_graphs_coord_input": crystal_unit_graphs_coord_input,
+               "molecular_graphs_coord_input": molecular_graphs_coord_input}
+    if name not in configs:
+        raise ValueError("Unknown model config '%s' for coGN, choose one of %s." % (name, list(configs.keys())))
+    return copy_config(configs[name])
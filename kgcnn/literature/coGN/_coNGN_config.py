@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 units = 160
 depth = 5
 nested_depth = 1
@@ -116,6 +114,6 @@ model_default_nested = {
         "edge_indices": {"shape": (None, 2), "name": "edge_indices", "dtype": "int32", "ragged": True},
     },
     "input_block_cfg": input_block_cfg,
-    "processing_blocks_cfg": [deepcopy(processing_block_cfg) for _ in range(depth)],
+    "processing_blocks_cfg": [processing_block_cfg] * depth,
     "output_block_cfg": output_block_cfg,
 }
@@ -66,7 +66,8 @@ class AtomEmbedding(GraphBaseLayer):
         )
 
     def call(self, inputs):
-        atomic_numbers = inputs
+        # Atomic numbers can be given as narrow integer type like 'int8', but gather requires int32 indices.
+        atomic_numbers = tf.cast(inputs, dtype="int32")
         idxs = atomic_numbers - 1  # Shifted by one (zero-indexed)
 
         feature_list = []
@@ -26,8 +26,9 @@ class ScaledMeanAbsoluteError(ks.metrics.MeanAbsoluteError):
         ks.backend.batch_set_value([(v, 0) for v in self.variables if 'kgcnn_scale_mae' not in v.name])
 
     def update_state(self, y_true, y_pred, sample_weight=None):
-        y_true = self.scale * y_true
-        y_pred = self.scale * y_pred
+        # Cast to dtype of scale before scaling, e.g. for predictions in half precision of mixed precision policies.
+        y_true = self.scale * tf.cast(y_true, dtype=self.scale.dtype)
+        y_pred = self.scale * tf.cast(y_pred, dtype=self.scale.dtype)
         return super(ScaledMeanAbsoluteError, self).update_state(y_true, y_pred, sample_weight=sample_weight)
 
     def get_config(self):
@@ -117,8 +118,9 @@ class ScaledRootMeanSquaredError(ks.metrics.RootMeanSquaredError):
         ks.backend.batch_set_value([(v, 0) for v in self.variables if 'kgcnn_scale_rmse' not in v.name])
 
     def update_state(self, y_true, y_pred, sample_weight=None):
-        y_true = self.scale * y_true
-        y_pred = self.scale * y_pred
+        # Cast to dtype of scale before scaling, e.g. for predictions in half precision of mixed precision policies.
+        y_true = self.scale * tf.cast(y_true, dtype=self.scale.dtype)
+        y_pred = self.scale * tf.cast(y_pred, dtype=self.scale.dtype)
         return super(ScaledRootMeanSquaredError, self).update_state(y_true, y_pred, sample_weight=sample_weight)
 
     def get_config(self):
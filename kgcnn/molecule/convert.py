@@ -1,5 +1,7 @@
 import os
 import logging
+import itertools
+import tempfile
 from typing import Callable
 from kgcnn.molecule.io import read_mol_list_from_sdf_file, read_xyz_file, read_smiles_file, write_mol_block_list_to_sdf, \
     parse_list_to_xyz_str
@@ -185,7 +187,29 @@ class MolConverter:
             raise ValueError("Conversion was not successful")
 
     @staticmethod
-    def _convert_parallel(conversion_method: Callable, smile_list: list, num_workers: int, *args):
+    def filter_valid(inputs: list, mol_list: list):
+        """Filter failed conversions, which are `None` in the list of converted molecules.
+
+        Args:
+            inputs (list): List of inputs for conversion, e.g. smiles.
+            mol_list (list): List of converted mol-strings of same length as `inputs` .
+
+        Returns:
+            tuple: List of inputs and mol-strings of successful conversions and list of indices of failed conversions.
+        """
+        MolConverter._check_is_same_length(inputs, mol_list)
+        valid_inputs, valid_mols, failed_index = [], [], []
+        for i, (x, mol) in enumerate(zip(inputs, mol_list)):
+            if mol is None:
+                failed_index.append(i)
+            else:
+                valid_inputs.append(x)
+                valid_mols.append(mol)
+        return valid_inputs, valid_mols, failed_index
+
+    @staticmethod
+    def _convert_parallel(conversion_method: Callable, smile_list: list, num_workers: int, *args,
+                          executor: ThreadPoolExecutor = None):
         if num_workers is None:
             num_workers = os.cpu_count()
 
@@ -195,12 +219,14 @@ class MolConverter:
         if num_workers == 1:
             mol_list = [conversion_method(x, *args) for x in smile_list]
             return mol_list
-        else:
-            arg_list = [(x,) + args for x in smile_list]
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                result = executor.map(conversion_method, *zip(*arg_list))
-            mol_list = list(result)
-            return mol_list
+
+        # Constant arguments are repeated lazily for each smile instead of building a list of argument tuples.
+        arg_lists = [itertools.repeat(x, len(smile_list)) for x in args]
+        if executor is not None:
+            return list(executor.map(conversion_method, smile_list, *arg_lists))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            mol_list = list(executor.map(conversion_method, smile_list, *arg_lists))
+        return mol_list
 
     @staticmethod
     def _single_smile_to_mol(smile: str,
@@ -247,17 +273,28 @@ class MolConverter:
         if external_program is None:
             smiles_list = read_smiles_file(smiles_path)
             mol_list = []
-            for i in range(0, len(smiles_list), batch_size):
-                mg = self._convert_parallel(
-                    self._single_smile_to_mol, smiles_list[i:i + batch_size], num_workers,
-                    # All args for _single_smile_to_mol.
-                    sanitize, add_hydrogen, make_conformers, optimize_conformer
-                )
-                mol_list = mol_list + mg
-                if logger is not None:
-                    logger.info(" ... converted molecules {0} from {1}".format(i + len(mg), len(smiles_list)))
-            # Check success
-            self._check_is_same_length(smiles_list, mol_list)
+            if num_workers is None:
+                num_workers = os.cpu_count()
+            # A single pool of workers is kept for all batches, instead of starting new workers for each batch.
+            executor = ThreadPoolExecutor(max_workers=num_workers) if num_workers != 1 else None
+            try:
+                for i in range(0, len(smiles_list), batch_size):
+                    mg = self._convert_parallel(
+                        self._single_smile_to_mol, smiles_list[i:i + batch_size], num_workers,
+                        # All args for _single_smile_to_mol.
+                        sanitize, add_hydrogen, make_conformers, optimize_conformer,
+                        executor=executor
+                    )
+                    mol_list.extend(mg)
+                    if logger is not None:
+                        logger.info(" ... converted molecules {0} from {1}".format(i + len(mg), len(smiles_list)))
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            # Check success. Failed conversions are kept as `None` to keep the order of the smiles file.
+            _, _, failed_index = self.filter_valid(smiles_list, mol_list)
+            if len(failed_index) > 0:
+                module_logger.warning("Failed conversion for %s of %s smiles." % (len(failed_index), len(smiles_list)))
             if sdf_path is not None:
                 write_mol_block_list_to_sdf(mol_list, sdf_path)
             return mol_list
@@ -265,13 +302,17 @@ class MolConverter:
         # External programs
         smiles_list = read_smiles_file(smiles_path)
 
-        if external_program["class_name"] == "balloon":
-            ext_program = BalloonInterface(**external_program["config"])
-            ext_program.run(input_file=smiles_path, output_file=sdf_path, output_format="sdf")
-        else:
+        if external_program["class_name"] != "balloon":
             raise ValueError("Unknown program for conversion of smiles '%s'" % external_program)
 
-        mol_list = read_mol_list_from_sdf_file(sdf_path)
+        # Without target path, the output is written to a temporary directory which is removed after reading,
+        # also if the external program raises an error.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = sdf_path if sdf_path is not None else os.path.join(temp_dir, "molecules.sdf")
+            ext_program = BalloonInterface(**external_program["config"])
+            ext_program.run(input_file=smiles_path, output_file=output_path, output_format="sdf")
+            mol_list = read_mol_list_from_sdf_file(output_path)
+
         self._check_is_same_length(smiles_list, mol_list)
         return mol_list
 
@@ -1,3 +1,4 @@
+import math
 import tensorflow as tf
 ks = tf.keras
 
@@ -12,7 +13,8 @@ def shifted_softplus(x):
     Returns:
         tf.Tensor: Output tensor computed as :math:`\log(e^{x}+1) - \log(2)`.
     """
-    return ks.activations.softplus(x) - ks.backend.log(2.0)
+    # Shift is a python constant, that is folded into the graph and fuses with softplus.
+    return ks.activations.softplus(x) - math.log(2.0)
 
 
 @tf.keras.utils.register_keras_serializable(package='kgcnn', name='softplus2')
@@ -50,3 +50,67 @@ def segment_ops_by_name(segment_name: str, data, segment_ids):
     else:
         raise TypeError("Unknown segment operation, choose: 'segment_mean', 'segment_sum', ...")
     return pool
+
+
+def segment_weighted_sum(data, weights, segment_ids, num_segments):
+    """Weighted sum of data per segment for each of the `K` channels of the weights. This is computed as a single
+    sparse-dense matrix multiplication of a `(K*num_segments, N)` sparse matrix holding the weights with the data,
+    so that the weighted data of shape `(N, K, F)` is never materialized. For half precision data, the sum is
+    accumulated in float32.
+
+    Args:
+        data (tf.Tensor): Data tensor of shape `(N, F)` .
+        weights (tf.Tensor): Weights for each data entry of shape `(N, K)` .
+        segment_ids (tf.Tensor): IDs of the segments of shape `(N, )` . Must be sorted for the sparse matrix to
+            have canonical ordering.
+        num_segments: Number of segments.
+
+    Returns:
+        tf.Tensor: Weighted segment sum of shape `(num_segments, K, F)` .
+    """
+    compute_dtype = "float32" if data.dtype in [tf.float16, tf.bfloat16] else data.dtype
+    # Static number of channels and features are used if known, so that the graph is specialized for them.
+    num_channels = weights.shape[1] if weights.shape[1] is not None else tf.shape(weights, out_type=tf.int64)[1]
+    num_features = data.shape[1] if data.shape[1] is not None else tf.shape(data, out_type=tf.int64)[1]
+    num_segments = tf.cast(num_segments, dtype=tf.int64)
+    num_data = tf.shape(data, out_type=tf.int64)[0]
+    # Row index of the sparse matrix is k*num_segments + segment_id.
+    rows = tf.reshape(
+        tf.expand_dims(tf.range(num_channels, dtype=tf.int64), axis=-1) * num_segments + tf.expand_dims(
+            tf.cast(segment_ids, dtype=tf.int64), axis=0), [-1])
+    cols = tf.tile(tf.range(num_data, dtype=tf.int64), [num_channels])
+    values = tf.reshape(tf.transpose(weights), [-1])
+    matrix = tf.SparseTensor(
+        indices=tf.stack([rows, cols], axis=-1), values=tf.cast(values, dtype=compute_dtype),
+        dense_shape=tf.stack([num_channels * num_segments, num_data]))
+    out = tf.sparse.sparse_dense_matmul(matrix, tf.cast(data, dtype=compute_dtype))
+    # (K*num_segments, F) -> (num_segments, K, F)
+    out = tf.reshape(out, [num_channels, -1, num_features])
+    out = tf.transpose(out, perm=[1, 0, 2])
+    return tf.cast(out, dtype=data.dtype)
+
+
+def segment_symmetric_pool(data, disjoint_index, num_segments, pooling_method: str = "mean"):
+    r"""Pool edge data for both indices :math:`i` and :math:`j` of the edge index :math:`(i, j)` and average the
+    two results. Both directions are pooled by a single unsorted segment operation, where segments
+    `[0, num_segments)` collect edges for the first index and `[num_segments, 2*num_segments)` for the second index.
+    Segments without edges in one direction contribute zero for that direction.
+
+    Args:
+        data (tf.Tensor): Flat edge data of shape `(M, F)` .
+        disjoint_index (tf.Tensor): Edge indices referring to the flat nodes of shape `(M, 2)` .
+        num_segments (tf.Tensor): Total number of nodes `N` .
+        pooling_method (str): Pooling method to use, either 'mean' or 'sum'. Default is 'mean'.
+
+    Returns:
+        tf.Tensor: Pooled edge data of shape `(N, F)` .
+    """
+    segment_ids = tf.concat([disjoint_index[:, 0], disjoint_index[:, 1] + num_segments], axis=0)
+    data = tf.concat([data, data], axis=0)
+    if pooling_method == "mean":
+        out = tf.math.unsorted_segment_mean(data, segment_ids, 2 * num_segments)
+    elif pooling_method == "sum":
+        out = tf.math.unsorted_segment_sum(data, segment_ids, 2 * num_segments)
+    else:
+        raise TypeError("Unknown pooling method '%s', choose: 'mean', 'sum'." % pooling_method)
+    return 0.5 * (out[:num_segments] + out[num_segments:])
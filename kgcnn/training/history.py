@@ -16,6 +16,26 @@ def load_history_list(file_path, folds):
     return history_list
 
 
+def save_kfold_splits(filepath: str, test_indices_list: list):
+    r"""Save original data indices of the splits of a cross-validation to a '.npz' file.
+
+    Train and test indices differ in length, so they are stored as object array of shape `(n_splits, 2)` under
+    the key 'splits'. Loading therefore requires `allow_pickle=True` , e.g.
+    `np.load(filepath, allow_pickle=True)["splits"]` .
+
+    Args:
+        filepath (str): Full path of the '.npz' file.
+        test_indices_list (list): List of `[train_index, test_index]` for each split.
+
+    Returns:
+        None.
+    """
+    kfold_splits = np.empty((len(test_indices_list), 2), dtype="object")
+    for j, (train_index, test_index) in enumerate(test_indices_list):
+        kfold_splits[j, 0], kfold_splits[j, 1] = train_index, test_index
+    np.savez(filepath, splits=kfold_splits)
+
+
 def save_history_score(
         histories: list,
         filepath: str = None,
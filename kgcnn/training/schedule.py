@@ -5,8 +5,8 @@ import tensorflow as tf
 @tf.keras.utils.register_keras_serializable(package='kgcnn', name='LinearWarmupExponentialDecay')
 class LinearWarmupExponentialDecay(tf.optimizers.schedules.LearningRateSchedule):
     r"""This schedule combines a linear warmup with an exponential decay.
-    Combines :obj:` tf.optimizers.schedules.PolynomialDecay` with an actual increase during warmup
-    and :obj:`tf.optimizers.schedules.ExponentialDecay` after.
+    Equivalent to combining :obj:`tf.optimizers.schedules.PolynomialDecay` with an actual increase during warmup
+    and :obj:`tf.optimizers.schedules.ExponentialDecay` after, but evaluated directly in closed form.
 
     Introduced by `DimeNetPP <https://arxiv.org/abs/2011.14115>`__ .
 
@@ -34,10 +34,16 @@ class LinearWarmupExponentialDecay(tf.optimizers.schedules.LearningRateSchedule)
         super().__init__()
         self._input_config_settings = {"learning_rate": learning_rate, "warmup_steps": warmup_steps,
                                        "decay_steps": decay_steps, "decay_rate": decay_rate, "staircase": staircase}
-        self.warmup = tf.optimizers.schedules.PolynomialDecay(
-            1 / warmup_steps, warmup_steps, end_learning_rate=1)
-        self.decay = tf.optimizers.schedules.ExponentialDecay(
-            learning_rate, decay_steps, decay_rate, staircase=staircase)
+        self._initial_learning_rate = learning_rate
+        self.warmup_steps = warmup_steps
+        self.decay_steps = decay_steps
+        self.decay_rate = decay_rate
+        self.staircase = staircase
+        # Constants of the closed form are computed once, so that a step only needs a single exponential.
+        # Warmup is identical to a linear polynomial decay from `1/warmup_steps` to 1 within `warmup_steps` .
+        self._inv_warmup_steps = 1.0 / float(warmup_steps)
+        self._warmup_range = 1.0 - 1.0 / float(warmup_steps)
+        self._log_decay_rate = float(np.log(decay_rate))
 
     def __call__(self, step):
         """Decay learning rate as a functions of steps.
@@ -48,15 +54,23 @@ class LinearWarmupExponentialDecay(tf.optimizers.schedules.LearningRateSchedule)
         Returns:
             float: New learning rate.
         """
-        return self.warmup(step) * self.decay(step)
+        with tf.name_scope("LinearWarmupExponentialDecay"):
+            initial_learning_rate = tf.convert_to_tensor(self._initial_learning_rate, name="initial_learning_rate")
+            dtype = initial_learning_rate.dtype
+            step = tf.cast(step, dtype=dtype)
+            warmup = 1.0 - self._warmup_range * (1.0 - tf.minimum(step * self._inv_warmup_steps, 1.0))
+            p = step / tf.cast(self.decay_steps, dtype=dtype)
+            if self.staircase:
+                p = tf.floor(p)
+            return warmup * initial_learning_rate * tf.exp(p * self._log_decay_rate)
 
     @property
     def initial_learning_rate(self):
-        return self.decay.initial_learning_rate
+        return self._initial_learning_rate
 
     @initial_learning_rate.setter
     def initial_learning_rate(self, value):
-        self.decay.initial_learning_rate = value
+        self._initial_learning_rate = value
 
     def get_config(self):
         """Get config for this class."""
@@ -0,0 +1,18 @@
+def copy_config(obj):
+    r"""Copy nested dicts, lists and tuples of a config, e.g. of a model or of a serialized optimizer or callbacks,
+    which may be modified afterwards. Shared references within the config are copied independently. Other objects
+    are not copied, which is faster than :obj:`deepcopy` on large configs.
+
+    Args:
+        obj: Config to copy, usually a dict.
+
+    Returns:
+        Copy of the config.
+    """
+    if isinstance(obj, dict):
+        return {key: copy_config(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [copy_config(x) for x in obj]
+    if isinstance(obj, tuple):
+        return tuple(copy_config(x) for x in obj)
+    return obj
@@ -0,0 +1,64 @@
+import os
+import logging
+import tensorflow as tf
+from tensorflow.python.framework.convert_to_constants import convert_variables_to_constants_v2
+
+ks = tf.keras
+
+logging.basicConfig()  # Module logger
+module_logger = logging.getLogger(__name__)
+module_logger.setLevel(logging.INFO)
+
+
+def freeze_model(model: ks.models.Model, input_signature: list = None):
+    r"""Freeze a keras model for inference. The model is traced as :obj:`tf.function` with `training=False`, and all
+    variables are replaced by constants in the graph of the concrete function. Ragged inputs are traced with their
+    values and row splits as flat placeholders.
+
+    .. note::
+
+        The frozen graph has only constant-shape ops for e.g. Gaussian centers or the unrolled depth of the model,
+        which are folded by grappler when the frozen function is executed. The TF1 graph transform tool is not
+        available in TF2 and not required for this.
+
+    Args:
+        model (ks.models.Model): Keras model to freeze. Must be called with a list of inputs.
+        input_signature (list): List of :obj:`tf.TensorSpec` or :obj:`tf.RaggedTensorSpec` for the model inputs.
+            If None, the type specs of the functional model inputs are used. Default is None.
+
+    Returns:
+        ConcreteFunction: Frozen concrete function of the model without variables.
+    """
+    if input_signature is None:
+        if not getattr(model, "inputs", None):
+            raise ValueError("Model '%s' has no defined inputs, please provide `input_signature`." % model.name)
+        input_signature = [x.type_spec for x in model.inputs]
+
+    @tf.function
+    def model_inference(*args):
+        return model(list(args), training=False)
+
+    concrete_function = model_inference.get_concrete_function(*input_signature)
+    frozen_function = convert_variables_to_constants_v2(concrete_function)
+    module_logger.info("Frozen graph of '%s' has %s nodes." % (
+        model.name, len(frozen_function.graph.as_graph_def().node)))
+    return frozen_function
+
+
+def save_frozen_graph(model: ks.models.Model, filepath: str, input_signature: list = None, as_text: bool = False):
+    r"""Freeze a keras model with :obj:`freeze_model` and write the graph definition to file.
+
+    Args:
+        model (ks.models.Model): Keras model to freeze. Must be called with a list of inputs.
+        filepath (str): File path for the graph definition, e.g. 'model.pb'.
+        input_signature (list): List of :obj:`tf.TensorSpec` or :obj:`tf.RaggedTensorSpec` for the model inputs.
+            If None, the type specs of the functional model inputs are used. Default is None.
+        as_text (bool): Whether to write the graph definition as text. Default is False.
+
+    Returns:
+        ConcreteFunction: Frozen concrete function of the model without variables.
+    """
+    frozen_function = freeze_model(model, input_signature=input_signature)
+    tf.io.write_graph(frozen_function.graph.as_graph_def(), logdir=os.path.dirname(os.path.abspath(filepath)),
+                      name=os.path.basename(filepath), as_text=as_text)
+    return frozen_function
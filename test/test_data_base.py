@@ -5,7 +5,7 @@ import typing as t
 import numpy as np
 
 from kgcnn.graph.base import GraphDict
-from kgcnn.data.base import MemoryGraphDataset
+from kgcnn.data.base import MemoryGraphDataset, MemoryGraphList
 
 
 class TestMemoryGraphDataset(unittest.TestCase):
@@ -85,6 +85,17 @@ class TestMemoryGraphDataset(unittest.TestCase):
         self.assertIsInstance(memory_dataset, MemoryGraphDataset)
         self.assertEqual(num_elements, len(memory_dataset))
 
+    def test_indexing_shares_graphs(self):
+        memory_dataset: MemoryGraphDataset = self.create_dataset(10)
+        for index in [np.array([7, 2, 5]), [7, 2, 5], (7, 2, 5)]:
+            subset = memory_dataset[index]
+            self.assertIs(type(subset), MemoryGraphList)
+            self.assertEqual(3, len(subset))
+            self.assertTrue(all([x is memory_dataset[i] for x, i in zip(subset, [7, 2, 5])]))
+        subset = memory_dataset[np.array([7, 2, 5])][np.array([2, 0])]
+        self.assertTrue(subset[0] is memory_dataset[5] and subset[1] is memory_dataset[7])
+        self.assertEqual(4, len(memory_dataset[2:6]))
+
     def test_get_train_test_indices_works(self):
         num_elements = 10
         train_ratio = 0.8
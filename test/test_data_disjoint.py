@@ -0,0 +1,37 @@
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from kgcnn.data.disjoint import disjoint_graph_from_numpy, disjoint_graph_from_ragged
+
+
+class TestDisjointGraph(unittest.TestCase):
+
+    nodes = [np.array([[0.0], [1.0], [2.0]]), np.array([[3.0]]), np.array([[4.0], [5.0]])]
+    edges = [np.array([[0.5], [1.5]]), np.array([[2.5]]), np.array([[3.5], [4.5], [5.5]])]
+    edge_indices = [np.array([[0, 1], [2, 1]]), np.array([[0, 0]]), np.array([[0, 1], [1, 0], [1, 1]])]
+
+    def test_disjoint_graph_from_numpy(self):
+        nodes, edges, edge_indices, batch_id = disjoint_graph_from_numpy(self.nodes, self.edges, self.edge_indices)
+        self.assertEqual(nodes.shape, (6, 1))
+        self.assertEqual(edges.shape, (6, 1))
+        self.assertTrue(np.all(edge_indices == np.array([[0, 1], [2, 1], [3, 3], [4, 5], [5, 4], [5, 5]])))
+        self.assertTrue(np.all(batch_id == np.array([0, 0, 0, 1, 2, 2])))
+
+    def test_disjoint_graph_from_numpy_empty(self):
+        with self.assertRaises(ValueError):
+            disjoint_graph_from_numpy([], [], [])
+
+    def test_disjoint_graph_from_ragged(self):
+        expected = disjoint_graph_from_numpy(self.nodes, self.edges, self.edge_indices)
+        result = disjoint_graph_from_ragged(
+            tf.ragged.constant(self.nodes, ragged_rank=1, inner_shape=(1,)),
+            tf.ragged.constant(self.edges, ragged_rank=1, inner_shape=(1,)),
+            tf.ragged.constant(self.edge_indices, ragged_rank=1, inner_shape=(2,), dtype="int64"))
+        for x, y in zip(expected, result):
+            self.assertTrue(np.allclose(x, y.numpy()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+import numpy as np
+from kgcnn.data.utils import ragged_tensor_from_nested_numpy, tf_dataset_from_tensors
+
+
+class TestTFDatasetFromTensors(unittest.TestCase):
+
+    def test_batches(self):
+        nodes = [np.array([[0.0]]), np.array([[1.0], [2.0]]), np.array([[3.0]]), np.array([[4.0], [5.0], [6.0]])]
+        x = ragged_tensor_from_nested_numpy(nodes)
+        y = np.arange(4, dtype="float32")[:, None]
+        batches = list(tf_dataset_from_tensors([x], y, batch_size=3))
+        self.assertEqual(2, len(batches))
+        (x_batch,), y_batch = batches[0]
+        self.assertTrue(np.all(x_batch.row_lengths().numpy() == np.array([1, 2, 1])))
+        self.assertTrue(np.all(y_batch.numpy() == y[:3]))
+
+    def test_shuffle(self):
+        x = ragged_tensor_from_nested_numpy([np.array([[float(i)]] * (i + 1)) for i in range(10)])
+        y = np.arange(10, dtype="float32")[:, None]
+        for (x_batch,), y_batch in tf_dataset_from_tensors([x], y, batch_size=4, shuffle=True, seed=1):
+            # Inputs and labels are gathered with the same indices.
+            self.assertTrue(np.all(x_batch.row_lengths().numpy() - 1 == y_batch.numpy()[:, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
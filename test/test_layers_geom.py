@@ -6,7 +6,7 @@ import tensorflow as tf
 from kgcnn.graph.methods import get_angle_indices
 from kgcnn.layers.geom import NodeDistanceEuclidean, EdgeAngle, NodePosition
 from kgcnn.literature.DimeNetPP._dimenet_conv import SphericalBasisLayer
-from kgcnn.layers.geom import BesselBasisLayer
+from kgcnn.layers.geom import BesselBasisLayer, GaussBasisLayer, NodeDistanceGaussBasis
 from kgcnn.layers.modules import LazySubtract
 
 
@@ -126,5 +126,30 @@ class TestBesselBasisLayer(unittest.TestCase):
         self.assertTrue(np.max(np.abs(test1 - bessel[1])) < 1e-5)
 
 
+class TestNodeDistanceGaussBasis(unittest.TestCase):
+
+    def test_matches_layer_chain(self):
+        x = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 2.0, 0.0],
+                      [0.5, 0.5, 0.5], [-1.0, 1.0, 0.0]])
+        ei = np.array([[0, 1], [1, 0], [0, 2], [2, 1], [0, 1], [1, 0]])
+        rag_x = tf.RaggedTensor.from_row_lengths(x, np.array([3, 2]))
+        rag_ei = tf.RaggedTensor.from_row_lengths(ei, np.array([4, 2]))
+        a, b = NodePosition()([rag_x, rag_ei])
+        expected = GaussBasisLayer()(NodeDistanceEuclidean()([a, b]))
+        result = NodeDistanceGaussBasis()([rag_x, rag_ei])
+        self.assertTrue(np.max(np.abs(expected.values.numpy() - result.values.numpy())) < 1e-5)
+        self.assertTrue(np.all(expected.row_splits.numpy() == result.row_splits.numpy()))
+
+    def test_mixed_precision(self):
+        x = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.5, 0.5, 0.5]])
+        ei = np.array([[0, 1], [1, 0], [0, 2], [0, 0]])
+        rag_x = tf.RaggedTensor.from_row_lengths(x.astype("float32"), np.array([3, 1]))
+        rag_ei = tf.RaggedTensor.from_row_lengths(ei, np.array([3, 1]))
+        expected = NodeDistanceGaussBasis()([rag_x, rag_ei])
+        result = NodeDistanceGaussBasis(dtype="mixed_float16")([rag_x, rag_ei])
+        self.assertEqual(result.dtype, tf.float16)
+        self.assertTrue(np.max(np.abs(expected.values.numpy() - result.values.numpy().astype("float32"))) < 1e-3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+import tensorflow as tf
+from kgcnn.layers.mlp import MLP
+
+
+class TestMLP(unittest.TestCase):
+
+    def test_jit_compile_ragged(self):
+        x = tf.RaggedTensor.from_row_lengths(np.random.normal(size=(7, 4)).astype("float32"), [3, 4])
+        mlp = MLP(units=[8, 2], activation=["swish", "linear"])
+        mlp_xla = MLP(units=[8, 2], activation=["swish", "linear"], jit_compile=True)
+        result = mlp(x)
+        mlp_xla(x)
+        mlp_xla.set_weights(mlp.get_weights())
+        result_xla = mlp_xla(x)
+        self.assertTrue(isinstance(result_xla, tf.RaggedTensor))
+        self.assertTrue(np.allclose(result_xla.row_splits.numpy(), x.row_splits.numpy()))
+        self.assertTrue(np.amax(np.abs(result_xla.values.numpy() - result.values.numpy())) < 1e-5)
+
+    def test_bucket_length(self):
+        lengths = MLP._bucket_length(tf.constant([0, 1, 2, 3, 5, 6, 7, 8, 9, 100, 1024], dtype="int32")).numpy()
+        self.assertTrue(np.all(lengths == np.array([1, 1, 2, 3, 6, 6, 8, 8, 12, 128, 1024])))
+
+    def test_jit_compile_config(self):
+        mlp = MLP(units=[8], jit_compile=True)
+        config = mlp.get_config()
+        self.assertTrue(config["jit_compile"])
+        self.assertTrue(MLP.from_config(config).jit_compile)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,8 @@ import unittest
 import numpy as np
 import tensorflow as tf
 
-from kgcnn.layers.pooling import PoolingLocalEdgesLSTM
+from kgcnn.layers.pooling import PoolingLocalEdgesLSTM, PoolingLocalEdges, PoolingSymmetricLocalEdges
+from kgcnn.layers.pooling import PoolingWeightedNodes
 from kgcnn.layers.gather import GatherNodes
 from kgcnn.layers.modules import LazyConcatenate
 
@@ -39,6 +40,42 @@ class TestPoolingLocalEdgesLSTM(unittest.TestCase):
         self.assertTrue(np.all(np.array(out[0].shape) == np.array([8,3])))
 
 
+class TestPoolingSymmetricLocalEdges(unittest.TestCase):
+
+    n1 = TestPoolingLocalEdgesLSTM.n1
+    ei1 = TestPoolingLocalEdgesLSTM.ei1
+    e1 = TestPoolingLocalEdgesLSTM.e1
+
+    def test_same_as_average_pooling(self):
+        n = tf.ragged.constant(self.n1, ragged_rank=1, inner_shape=(1,))
+        edi = tf.ragged.constant(self.ei1, ragged_rank=1, inner_shape=(2,))
+        ed = tf.ragged.constant(self.e1, ragged_rank=1, inner_shape=(1,))
+
+        pool_in = PoolingLocalEdges(pooling_method="mean", pooling_index=0)([n, ed, edi])
+        pool_out = PoolingLocalEdges(pooling_method="mean", pooling_index=1)([n, ed, edi])
+        expected = 0.5 * (pool_in.values + pool_out.values)
+
+        out = PoolingSymmetricLocalEdges(pooling_method="mean")([n, ed, edi])
+        self.assertTrue(np.all(np.array(out.row_splits) == np.array(n.row_splits)))
+        self.assertTrue(np.allclose(out.values.numpy(), expected.numpy()))
+
+
+class TestPoolingWeightedNodes(unittest.TestCase):
+
+    n1 = TestPoolingLocalEdgesLSTM.n1
+
+    def test_same_as_weighted_reduce(self):
+        n = tf.ragged.constant(self.n1, ragged_rank=1, inner_shape=(1,))
+        n = tf.concat([n, 2.0 * n], axis=-1)
+        w = tf.RaggedTensor.from_row_splits(
+            tf.cast(tf.range(tf.shape(n.values)[0]) % 3, dtype=n.dtype)[:, None], n.row_splits)
+
+        for pooling_method, reduce in [("sum", tf.reduce_sum), ("mean", tf.reduce_mean)]:
+            expected = reduce(n * w, axis=1)
+            out = PoolingWeightedNodes(pooling_method=pooling_method)([n, w])
+            self.assertTrue(np.allclose(out.numpy(), expected.numpy()))
+
+
 if __name__ == '__main__':
     unittest.main()
 
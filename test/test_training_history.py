@@ -0,0 +1,25 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from kgcnn.training.history import save_kfold_splits
+
+
+class TestSaveKFoldSplits(unittest.TestCase):
+
+    def test_ragged_splits(self):
+        test_indices_list = [[np.arange(5), np.arange(5, 7)], [np.arange(2, 7), np.arange(2)]]
+        with tempfile.TemporaryDirectory() as path:
+            filepath = os.path.join(path, "kfold_splits.npz")
+            save_kfold_splits(filepath, test_indices_list)
+            splits = np.load(filepath, allow_pickle=True)["splits"]
+        self.assertEqual(splits.shape, (2, 2))
+        for (train_index, test_index), (train_loaded, test_loaded) in zip(test_indices_list, splits):
+            self.assertTrue(np.all(train_index == train_loaded))
+            self.assertTrue(np.all(test_index == test_loaded))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from kgcnn.layers.modules import DenseEmbedding
+from kgcnn.layers.pooling import PoolingNodes
+from kgcnn.utils.freeze import freeze_model, save_frozen_graph
+
+ks = tf.keras
+
+
+class TestFreezeModel(unittest.TestCase):
+
+    def test_dense_model(self):
+        x_in = ks.layers.Input(shape=(3,))
+        out = ks.layers.Dense(2)(ks.layers.Dense(4, activation="relu")(x_in))
+        model = ks.models.Model(inputs=[x_in], outputs=out)
+
+        x = np.random.normal(size=(5, 3)).astype("float32")
+        frozen_function = freeze_model(model)
+        self.assertEqual(len(frozen_function.graph.get_collection("variables")), 0)
+        # The frozen function returns a list of flat output tensors.
+        result = frozen_function(tf.constant(x))[0]
+        self.assertTrue(np.allclose(result.numpy(), model(x).numpy(), atol=1e-5))
+
+    def test_ragged_model(self):
+        n_in = ks.layers.Input(shape=(None, 3), ragged=True)
+        n = DenseEmbedding(4, activation="relu")(n_in)
+        out = ks.layers.Dense(1)(PoolingNodes()(n))
+        model = ks.models.Model(inputs=[n_in], outputs=out)
+
+        x = tf.RaggedTensor.from_row_lengths(np.random.normal(size=(7, 3)).astype("float32"), [3, 4])
+        frozen_function = freeze_model(model)
+        # Ragged inputs are fed as values and row splits.
+        result = frozen_function(x.values, x.row_splits)[0]
+        self.assertTrue(np.allclose(result.numpy(), model(x).numpy(), atol=1e-5))
+
+    def test_save_frozen_graph(self):
+        x_in = ks.layers.Input(shape=(3,))
+        model = ks.models.Model(inputs=[x_in], outputs=ks.layers.Dense(2)(x_in))
+        with tempfile.TemporaryDirectory() as path:
+            filepath = os.path.join(path, "model.pb")
+            save_frozen_graph(model, filepath)
+            self.assertTrue(os.path.exists(filepath))
+            graph_def = tf.compat.v1.GraphDef()
+            with open(filepath, "rb") as f:
+                graph_def.ParseFromString(f.read())
+            self.assertFalse(any(node.op in ["VarHandleOp", "ReadVariableOp"] for node in graph_def.node))
+
+
+if __name__ == '__main__':
+    unittest.main()
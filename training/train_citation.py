@@ -1,12 +1,15 @@
+import matplotlib as mpl
+mpl.use('Agg')
 import numpy as np
 import argparse
 import os
 import time
 from tensorflow_addons import optimizers
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 import kgcnn.training.schedule
 import kgcnn.training.scheduler
-from kgcnn.training.history import save_history_score
+from kgcnn.training.history import save_history_score, save_kfold_splits
 from kgcnn.metrics.metrics import ScaledMeanAbsoluteError, ScaledRootMeanSquaredError
 from sklearn.model_selection import KFold
 # from sklearn.preprocessing import StandardScaler
@@ -78,31 +81,44 @@ y_train = np.array(labels)
 
 # Cross-validation via random KFold split form `sklearn.model_selection`.
 kf = KFold(**hyper["training"]["cross_validation"]["config"])
+# The splits are materialized once as list of train and test indices.
+train_test_indices = list(kf.split(X=np.arange(len(labels[0]))[:, None]))
+
+
+def make_and_compile_model(print_summary: bool = False):
+    # Make the model for current split using model kwargs from hyperparameter.
+    # They are always updated on top of the models default kwargs.
+    model_split = make_model(**hyper["model"]["config"])
+    # Compile model with optimizer and loss from hyperparameter.
+    # Since we use a sample weights for validation, the 'weighted_metrics' parameter has to be used for metrics.
+    model_split.compile(**hyper.compile(weighted_metrics=None))
+    if print_summary:
+        print(model_split.summary())
+    return model_split
+
+
+# Sample weight masks for train and validation nodes are allocated once as int8 for all splits.
+# Requires one graph in the batch.
+train_mask = np.zeros((1, len(labels[0])), dtype="int8")
+val_mask = np.zeros((1, len(labels[0])), dtype="int8")
 
 # Iterate over the cross-validation splits.
 # Indices for train-test splits are stored in 'test_indices_list'.
 history_list, test_indices_list, model, hist = [], [], None, None
-for train_index, test_index in kf.split(X=np.arange(len(labels[0]))[:, None]):
+for train_index, test_index in train_test_indices:
 
-    # Make the model for current split using model kwargs from hyperparameter.
-    # They are always updated on top of the models default kwargs.
-    model = make_model(**hyper["model"]["config"])
+    # The model is identical for all splits, so the summary is only printed once.
+    model = make_and_compile_model(print_summary=model is None)
 
     # For semi-supervised learning with keras, revert to mask to hide nodes during training and for validation.
-    val_mask = np.zeros_like(labels[0][:, 0])
-    train_mask = np.zeros_like(labels[0][:, 0])
-    val_mask[test_index] = 1
-    train_mask[train_index] = 1
-    # Requires one graph in the batch
-    val_mask = np.expand_dims(val_mask, axis=0)
-    train_mask = np.expand_dims(train_mask, axis=0)
-
-    # Compile model with optimizer and loss from hyperparameter.
-    # Since we use a sample weights for validation, the 'weighted_metrics' parameter has to be used for metrics.
-    model.compile(**hyper.compile(weighted_metrics=None))
-    print(model.summary())
+    # Masks are filled in place, keras casts them to the dtype of the loss.
+    train_mask.fill(0)
+    val_mask.fill(0)
+    train_mask[0, train_index] = 1
+    val_mask[0, test_index] = 1
 
     # Run keras model-fit and take time for training.
+    # A single fit over all epochs with validation every 'validation_freq' epochs, without re-entering fit.
     start = time.process_time()
     hist = model.fit(x_train, y_train,
                      validation_data=(x_train, y_train, val_mask),
@@ -120,16 +136,19 @@ for train_index, test_index in kf.split(X=np.arange(len(labels[0]))[:, None]):
 filepath = hyper.results_file_path()
 postfix_file = hyper["info"]["postfix_file"]
 
-# Plot training- and test-loss vs epochs for all splits.
-plot_train_test_loss(history_list, loss_name=None, val_loss_name=None,
-                     model_name=model_name, data_unit="", dataset_name=dataset_name, filepath=filepath,
-                     file_name=f"loss{postfix_file}.png")
-
-# Save keras-model to output-folder.
-model.save(os.path.join(filepath, f"model{postfix_file}"))
+# Save keras-model to output-folder. Model and splits are written in a background thread, while plots and
+# scores are written in the main thread.
+save_executor = ThreadPoolExecutor(max_workers=1)
+save_futures = [save_executor.submit(model.save, os.path.join(filepath, f"model{postfix_file}"))]
 
 # Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
+save_futures.append(save_executor.submit(
+    save_kfold_splits, os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list))
+
+# Plot training- and test-loss vs epochs for all splits. Figures are only saved to file.
+plot_train_test_loss(history_list, loss_name=None, val_loss_name=None,
+                     model_name=model_name, data_unit="", dataset_name=dataset_name, filepath=filepath,
+                     file_name=f"loss{postfix_file}.png", show_fig=False)
 
 # Save hyperparameter again, which were used for this fit.
 hyper.save(os.path.join(filepath, f"{model_name}_hyper{postfix_file}.json"))
@@ -139,4 +158,9 @@ data_unit = hyper["data"]["data_unit"] if "data_unit" in hyper["data"] else ""
 save_history_score(history_list, loss_name=None, val_loss_name=None,
                    model_name=model_name, data_unit=data_unit, dataset_name=dataset_name,
                    model_class=make_function,
-                   filepath=filepath, file_name=f"score{postfix_file}.yaml")
\ No newline at end of file
+                   filepath=filepath, file_name=f"score{postfix_file}.yaml")
+
+# Wait for model and splits to be saved. Calling result() re-raises any error from the background thread.
+for future in save_futures:
+    future.result()
+save_executor.shutdown(wait=True)
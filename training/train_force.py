@@ -9,7 +9,7 @@ from datetime import timedelta
 from tensorflow_addons import optimizers, metrics
 import kgcnn.training.schedule
 import kgcnn.training.scheduler
-from kgcnn.training.history import save_history_score
+from kgcnn.training.history import save_history_score, save_kfold_splits
 from sklearn.model_selection import KFold
 from kgcnn.utils.plots import plot_train_test_loss, plot_predict_true
 from kgcnn.model.utils import get_model_class
@@ -235,7 +235,7 @@ for i, (train_index, test_index) in enumerate(train_test_indices):
 
 
 # Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
+save_kfold_splits(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
 
 # Plot training- and test-loss vs epochs for all splits.
 data_unit = hyper["data"]["data_unit"] if "data_unit" in hyper["data"] else ""
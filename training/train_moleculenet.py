@@ -9,7 +9,7 @@ from kgcnn.data.moleculenet import MoleculeNetDataset
 import kgcnn.training.schedule
 import kgcnn.training.scheduler
 import kgcnn.metrics.loss
-from kgcnn.training.history import save_history_score
+from kgcnn.training.history import save_history_score, save_kfold_splits
 from kgcnn.metrics.metrics import ScaledMeanAbsoluteError, ScaledRootMeanSquaredError
 from sklearn.model_selection import KFold
 from sklearn.preprocessing import StandardScaler as StandardLabelScaler
@@ -161,7 +161,7 @@ plot_predict_true(predicted_y, true_y,
 model.save(os.path.join(filepath, f"model{postfix_file}"))
 
 # Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
+save_kfold_splits(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
 
 # Save hyperparameter again, which were used for this fit. Format is '.json'
 # If non-serialized parameters were in the hyperparameter config file, this operation may fail.
@@ -1,20 +1,23 @@
 import numpy as np
+import tensorflow as tf
 import matplotlib as mpl
-# mpl.use('Agg')
+mpl.use('Agg')
 import time
 import os
 import argparse
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from tensorflow_addons import optimizers, metrics
 from kgcnn.data.qm import QMGraphLabelScaler
 import kgcnn.training.schedule
 import kgcnn.training.scheduler
-from kgcnn.training.history import save_history_score
+from kgcnn.training.history import save_history_score, save_kfold_splits
 from kgcnn.metrics.metrics import ScaledMeanAbsoluteError, ScaledRootMeanSquaredError
 from sklearn.model_selection import KFold
 from kgcnn.utils.plots import plot_train_test_loss, plot_predict_true
 from kgcnn.model.utils import get_model_class
 from kgcnn.data.serial import deserialize as deserialize_dataset
+from kgcnn.data.utils import tf_dataset_from_tensors
 from kgcnn.hyper.hyper import HyperParameter
 from kgcnn.utils.devices import set_devices_gpu
 
@@ -31,6 +34,8 @@ parser.add_argument("--gpu", required=False, help="GPU index used for training."
                     default=None, nargs="+", type=int)
 parser.add_argument("--fold", required=False, help="Split or fold indices to run.",
                     default=None, nargs="+", type=int)
+parser.add_argument("--mixed_precision", required=False, help="Name of mixed precision policy, e.g. 'mixed_bfloat16'.",
+                    default=None)
 args = vars(parser.parse_args())
 print("Input of argparse:", args)
 
@@ -41,6 +46,7 @@ hyper_path = args["hyper"]
 make_function = args["make"]
 gpu_to_use = args["gpu"]
 execute_folds = args["fold"]
+mixed_precision = args["mixed_precision"]
 
 # Assigning GPU.
 set_devices_gpu(gpu_to_use)
@@ -48,6 +54,15 @@ set_devices_gpu(gpu_to_use)
 # HyperParameter is used to store and verify hyperparameter.
 hyper = HyperParameter(hyper_path, model_name=model_name, model_class=make_function, dataset_name=dataset_name)
 
+# Optional mixed precision policy, which can also be set in hyperparameter. Must be set before making the model.
+# Variables and the scaler stay in float32. For 'mixed_float16', keras compile wraps the optimizer with loss scaling.
+# Models should cast their output to float32, i.e. the variable dtype of the policy, like e.g. `Schnet` .
+if "mixed_precision" in hyper["training"]:
+    mixed_precision = hyper["training"]["mixed_precision"]
+if mixed_precision:
+    print("Using mixed precision policy '%s'." % mixed_precision)
+    tf.keras.mixed_precision.set_global_policy(mixed_precision)
+
 # Model Selection to load a model definition from a module in kgcnn.literature
 make_model = get_model_class(model_name, make_function)
 
@@ -89,11 +104,19 @@ if multi_target_indices is not None:
         label_names = [label_names[i] for i in multi_target_indices]
     if label_units is not None:
         label_units = [label_units[i] for i in multi_target_indices]
+# Labels are cast once to float32 for all splits, which is also the dtype keras uses for targets.
+labels = np.ascontiguousarray(labels, dtype="float32")
 print("Labels %s in %s have shape %s" % (label_names, label_units, labels.shape))
 
 # For QMDataset, also the atomic number is required to properly pre-scale extensive quantities like total energy.
 atoms = dataset.obtain_property("node_number")
 
+# The model input of the full dataset is converted into tensors only once. Training and test tensors of each split
+# are then gathered from these tensors by index, instead of converting the graphs again for every split.
+# Which property of the dataset and whether the tensor will be ragged is retrieved from the
+# kwargs of the keras `Input` layers ('name' and 'ragged').
+x_data = dataset.tensor(hyper["model"]["config"]["inputs"])
+
 # Cross-validation via random KFold split form `sklearn.model_selection`.
 # Or from dataset information.
 if hyper["training"]["cross_validation"] is None:
@@ -124,11 +147,10 @@ for i, (train_index, test_index) in enumerate(train_test_indices):
     # They are always updated on top of the models default kwargs.
     model = make_model(**hyper["model"]["config"])
 
-    # First select training and test graphs from indices, then convert them into tensorflow tensor
-    # representation. Which property of the dataset and whether the tensor will be ragged is retrieved from the
-    # kwargs of the keras `Input` layers ('name' and 'ragged').
-    x_train, y_train = dataset[train_index].tensor(hyper["model"]["config"]["inputs"]), labels[train_index]
-    x_test, y_test = dataset[test_index].tensor(hyper["model"]["config"]["inputs"]), labels[test_index]
+    # Select training and test graphs from indices of the tensor representation of the full dataset.
+    x_train = [tf.gather(x, train_index, axis=0) for x in x_data]
+    x_test = [tf.gather(x, test_index, axis=0) for x in x_data]
+    y_train, y_test = labels[train_index], labels[test_index]
     # Also keep the same information for atomic numbers of the molecules.
     atoms_test = [atoms[i] for i in test_index]
     atoms_train = [atoms[i] for i in train_index]
@@ -139,11 +161,14 @@ for i, (train_index, test_index) in enumerate(train_test_indices):
     if "scaler" in hyper["training"]:
         print("Using QMGraphLabelScaler.")
         # Atomic number argument here!
+        # Indexing labels already makes a copy for each split, which can therefore be transformed in place.
         scaler = QMGraphLabelScaler(**hyper["training"]["scaler"]["config"]).fit(y=y_train, atomic_number=atoms_train)
-        y_train = scaler.transform(y=y_train, atomic_number=atoms_train)
-        y_test = scaler.transform(y=y_test, atomic_number=atoms_test)
+        y_train = scaler.transform(y=y_train, atomic_number=atoms_train, copy=False)
+        y_test = scaler.transform(y=y_test, atomic_number=atoms_test, copy=False)
 
         # If scaler was used we add rescaled standard metrics to compile.
+        # The scaler can not be folded into the last layer of the model, since extensive scaler subtract an offset
+        # that depends on the atomic composition of each molecule. The loss is computed on scaled targets.
         scaler_scale = scaler.get_scaling()
         mae_metric = ScaledMeanAbsoluteError(scaler_scale.shape, name="scaled_mean_absolute_error")
         rms_metric = ScaledRootMeanSquaredError(scaler_scale.shape, name="scaled_root_mean_squared_error")
@@ -159,11 +184,19 @@ for i, (train_index, test_index) in enumerate(train_test_indices):
     model.compile(**hyper.compile(loss="mean_absolute_error", metrics=metrics))
     print(model.summary())
 
+    # Batches are gathered from the tensors of the split with a prefetching `tf.data.Dataset` , so that the next
+    # batch is prepared while training on the current one.
+    hyper_fit = hyper.fit(batch_size=32)
+    batch_size = hyper_fit.pop("batch_size")
+    shuffle = hyper_fit.pop("shuffle", True)
+    train_dataset = tf_dataset_from_tensors(x_train, y_train, batch_size=batch_size, shuffle=shuffle)
+    test_dataset = tf_dataset_from_tensors(x_test, y_test, batch_size=batch_size)
+
     # Start and time training
     start = time.process_time()
-    hist = model.fit(x_train, y_train,
-                     validation_data=(x_test, y_test),
-                     **hyper.fit())
+    hist = model.fit(train_dataset,
+                     validation_data=test_dataset,
+                     **hyper_fit)
     stop = time.process_time()
     print("Print Time for training: ", str(timedelta(seconds=stop - start)))
 
@@ -176,16 +209,26 @@ for i, (train_index, test_index) in enumerate(train_test_indices):
 filepath = hyper.results_file_path()
 postfix_file = hyper["info"]["postfix_file"]
 
-# Plot training- and test-loss vs epochs for all splits.
+# Prediction of last split for plot.
+predicted_y = model.predict(x_test, verbose=0)
+true_y = y_test
+
+# Save keras-model to output-folder. Model and splits are written in a background thread, while plots and
+# scores are written in the main thread.
+save_executor = ThreadPoolExecutor(max_workers=1)
+save_futures = [save_executor.submit(model.save, os.path.join(filepath, f"model{postfix_file}"))]
+
+# Save original data indices of the splits.
+save_futures.append(save_executor.submit(
+    save_kfold_splits, os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list))
+
+# Plot training- and test-loss vs epochs for all splits. Figures are only saved to file.
 data_unit = hyper["data"]["data_unit"] if "data_unit" in hyper["data"] else ""
 plot_train_test_loss(history_list, loss_name=None, val_loss_name=None,
                      model_name=model_name, data_unit=data_unit, dataset_name=dataset_name,
-                     filepath=filepath, file_name=f"loss{postfix_file}.png")
+                     filepath=filepath, file_name=f"loss{postfix_file}.png", show_fig=False)
 
 # Plot prediction
-predicted_y = model.predict(x_test, verbose=0)
-true_y = y_test
-
 if scaler:
     predicted_y = scaler.inverse_transform(y=predicted_y, atomic_number=atoms_test)
     true_y = scaler.inverse_transform(y=true_y, atomic_number=atoms_test)
@@ -195,12 +238,6 @@ plot_predict_true(predicted_y, true_y,
                   model_name=model_name, dataset_name=dataset_name, target_names=label_names,
                   file_name=f"predict{postfix_file}.png")
 
-# Save keras-model to output-folder.
-model.save(os.path.join(filepath, f"model{postfix_file}"))
-
-# Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
-
 # Save hyperparameter again, which were used for this fit.
 hyper.save(os.path.join(filepath, f"{model_name}_hyper{postfix_file}.json"))
 
@@ -209,3 +246,8 @@ save_history_score(history_list, loss_name=None, val_loss_name=None,
                    model_name=model_name, data_unit=data_unit, dataset_name=dataset_name,
                    model_class=make_function, multi_target_indices=multi_target_indices, execute_folds=execute_folds,
                    filepath=filepath, file_name=f"score{postfix_file}.yaml")
+
+# Wait for model and splits to be saved. Calling result() re-raises any error from the background thread.
+for future in save_futures:
+    future.result()
+save_executor.shutdown(wait=True)
@@ -6,7 +6,7 @@ from datetime import timedelta
 from kgcnn.data.tudataset import GraphTUDataset
 import kgcnn.training.schedule
 import kgcnn.training.scheduler
-from kgcnn.training.history import save_history_score
+from kgcnn.training.history import save_history_score, save_kfold_splits
 from kgcnn.metrics.metrics import ScaledMeanAbsoluteError, ScaledRootMeanSquaredError
 from tensorflow_addons import optimizers
 from kgcnn.data.transform.scaler.scaler import StandardLabelScaler
@@ -154,7 +154,7 @@ plot_predict_true(predicted_y, true_y,
                   file_name=f"predict{postfix_file}.png")
 
 # Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
+save_kfold_splits(os.path.join(filepath, f"{model_name}_kfold_splits{postfix_file}.npz"), test_indices_list)
 
 # Save score of fit result for as text file.
 save_history_score(history_list, loss_name=None, val_loss_name=None,